@@ -1,10 +1,26 @@
-from ._session import NullSessionInstance, SessionDictInstance, SessionInstanceBase, SessionManager
+from typing import TYPE_CHECKING
+
+from ._session import (NullSessionInstance, SessionDictInstance, SessionInstanceBase, SessionManager,
+                       TypedSessionInstance)
 from . import exceptions
 
+if TYPE_CHECKING:
+    from ._async import AsyncSessionManager
+
 __all__ = [
     'SessionManager',
+    'AsyncSessionManager',
     'SessionDictInstance',
     'SessionInstanceBase',
+    'TypedSessionInstance',
     'NullSessionInstance',
     'exceptions',
 ]
+
+
+def __getattr__(name):
+    # Imported on first use, so applications that don't use it don't pay for importing asyncio
+    if name == 'AsyncSessionManager':
+        from ._async import AsyncSessionManager  # pylint: disable=import-outside-toplevel
+        return AsyncSessionManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,223 @@
+# The async manager intentionally mirrors the request handling of SessionManager
+# pylint: disable=duplicate-code
+import asyncio
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, overload
+
+from . import _session
+from ._session import (BATCH_GET_BACKOFF_SECONDS, BATCH_GET_MAX_ATTEMPTS, BATCH_GET_MAX_BACKOFF_SECONDS,
+                       BOTO_CLIENT_CONFIG, DynamoData, SessionDictInstance, SessionManagerBase, T, boto_client_kwargs,
+                       dynamo_data_from_item)
+from .exceptions import BatchLoadError
+
+_AsyncClientKey = Tuple[Optional[str], Optional[str], asyncio.AbstractEventLoop]
+
+_aio_clients: Dict[_AsyncClientKey, 'asyncio.Task[Any]'] = {}
+
+
+@lru_cache(maxsize=None)
+def _aio_session():
+    # aiobotocore is an optional dependency, only needed by the async session manager
+    from aiobotocore.session import get_session  # pylint: disable=import-outside-toplevel
+    return get_session()
+
+
+async def shared_aio_client(endpoint_url: Optional[str], region_name: Optional[str]):
+    """ Returns an aiobotocore DynamoDB client shared by every caller using the same endpoint and region on the running
+    event loop. aiobotocore clients hold an aiohttp connection pool, which can't be used from another event loop.
+    """
+    key = (endpoint_url, region_name, asyncio.get_running_loop())
+    # The task creating the client is cached, rather than the client, so concurrent first callers wait for the same
+    # client instead of each creating one while credentials are resolved
+    client_task = _aio_clients.get(key)
+    if client_task is None:
+        client_context = _aio_session().create_client('dynamodb', config=BOTO_CLIENT_CONFIG,
+                                                      **boto_client_kwargs(endpoint_url, region_name))
+        client_coroutine = client_context.__aenter__()  # pylint: disable=unnecessary-dunder-call
+        client_task = _aio_clients[key] = asyncio.ensure_future(client_coroutine)
+    try:
+        # Shielded, so a cancelled caller doesn't cancel the client's creation for the others
+        return await asyncio.shield(client_task)
+    except Exception:
+        if client_task.done() and _aio_clients.get(key) is client_task:
+            del _aio_clients[key]
+        raise
+
+
+async def close_shared_aio_client(endpoint_url: Optional[str], region_name: Optional[str]) -> None:
+    client_task = _aio_clients.pop((endpoint_url, region_name, asyncio.get_running_loop()), None)
+    if client_task is not None:
+        client = await client_task
+        await client.__aexit__(None, None, None)  # pylint: disable=unnecessary-dunder-call
+
+
+class AsyncSessionManager(SessionManagerBase[T]):  # pylint: disable=too-many-instance-attributes
+    """ A session manager for asyncio applications, which sends requests to DynamoDB using aiobotocore. Sessions are
+    stored the same way as `SessionManager`, so both can be used with the same table.
+
+    Requires the `async` extra, i.e. `pip install dynamodb-session-web[async]`.
+    """
+
+    @overload
+    def __init__(self: 'AsyncSessionManager[SessionDictInstance]', **kwargs) -> None:  # pragma: no cover
+        ...
+
+    @overload
+    def __init__(self: 'AsyncSessionManager[T]', data_type: Type[T], **kwargs) -> None:  # pragma: no cover
+        ...
+
+    def __init__(self, data_type: Type[T] = SessionDictInstance, **kwargs) -> None:  # type: ignore
+        """ Creates a new AsyncSessionManager instance.
+
+        :param data_type: The data type to use for session instances. Defaults to SessionDictInstance.
+        :param kwargs: See `SessionManagerBase`. The `SessionManager` settings `dax_endpoint_url` and
+            `touch_in_background` aren't supported.
+        """
+        for unsupported in ('dax_endpoint_url', 'touch_in_background'):
+            if kwargs.get(unsupported):
+                raise ValueError(f'AsyncSessionManager does not support {unsupported}')
+        super().__init__(data_type, **kwargs)
+
+    async def __aenter__(self) -> 'AsyncSessionManager[T]':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def create_and_save(self, *,
+                              idle_timeout_seconds: Optional[int] = None,
+                              absolute_timeout_seconds: Optional[int] = None) -> T:
+        """ Creates a session instance, and persists it in the database.
+
+        :param idle_timeout_seconds: Idle timeout specific to this session instance.
+        Defaults to session manager's value.
+
+        :param absolute_timeout_seconds: Absolute timeout specific to this session instance.
+        Defaults to session manager's value.
+
+        :return: A new session instance
+        """
+        session_data_object = self.create(idle_timeout_seconds=idle_timeout_seconds,
+                                          absolute_timeout_seconds=absolute_timeout_seconds)
+        # The new instance's creation time doubles as its save time
+        await self._save(session_data_object, session_data_object.created)
+        return session_data_object
+
+    async def load(self, session_id) -> T:
+        data = await self._perform_get(session_id) if self._is_loadable_session_id(session_id) else None
+        return self._loaded_session(session_id, data)
+
+    async def batch_load(self, session_ids: List[str]) -> Dict[str, T]:
+        """ Loads multiple sessions, sending their `BatchGetItem` requests concurrently.
+
+        Unlike `load`, this does not refresh the `accessed` and `expires` attributes of the loaded sessions.
+
+        :param session_ids: The session IDs to load.
+
+        :return: A dictionary of session ID to session instance. Invalid, unknown, and expired session IDs are omitted.
+
+        :raises BatchLoadError: See `SessionManager.batch_load`.
+        """
+        now = _session.current_timestamp()
+        sessions = {}
+        for items in await asyncio.gather(*(self._dynamo_batch_get(chunk)
+                                            for chunk in self._batch_load_ids(session_ids))):
+            sessions.update(self._batch_loaded_sessions(items, now))
+        return sessions
+
+    async def save(self, data: T):
+        await self._save(data, _session.current_datetime())
+
+    async def _save(self, data: T, current_dt: datetime):
+        await self._dynamo_set(self._dynamo_data(data), data.session_id, current_dt)
+
+    async def clear(self, session_id):
+        await self._dynamo_remove(session_id)
+
+    async def close(self) -> None:
+        """ Closes the DynamoDB client used by this manager on the running event loop, which is shared with any other
+        async session manager using the same endpoint and region.
+        """
+        await close_shared_aio_client(self.endpoint_url, self.region_name)
+
+    async def _dynamo_remove(self, session_id):
+        client = await self.boto_client()
+        await client.delete_item(TableName=self.table_name, Key={'id': {'S': session_id}})
+
+    async def _perform_get(self, session_id) -> Optional[DynamoData]:
+        current_dt = _session.current_datetime()
+        if self._touch_interval <= 0:
+            return await self._dynamo_get(session_id, current_dt)
+
+        now = int(current_dt.timestamp())
+        item = await self._dynamo_read(session_id, now)
+        if item is None:
+            return None
+        data = dynamo_data_from_item(item)
+        if self._needs_touch(data, now):
+            await self._dynamo_refresh(item, session_id, current_dt, 'NONE')
+        return data
+
+    async def _dynamo_read(self, session_id, now: int) -> Optional[Dict[str, Any]]:
+        client = await self.boto_client()
+        item = (await client.get_item(**self._read_request(session_id))).get('Item')
+        if item is None or int(item['expires']['N']) <= now:
+            return None
+        return item
+
+    async def _dynamo_batch_get(self, session_ids: List[str]) -> List[Dict[str, Any]]:
+        """ See `SessionManager._dynamo_batch_get`. """
+        client = await self.boto_client()
+        items: List[Dict[str, Any]] = []
+        request_items = self._batch_get_request_items(session_ids)
+        backoff = BATCH_GET_BACKOFF_SECONDS
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, BATCH_GET_MAX_BACKOFF_SECONDS)
+            res = await client.batch_get_item(RequestItems=request_items)
+            items.extend(res['Responses'].get(self.table_name, []))
+            request_items = res.get('UnprocessedKeys')
+            if not request_items:
+                return items
+        raise BatchLoadError(len(request_items[self.table_name]['Keys']))
+
+    async def _dynamo_get(self, session_id, current_dt: datetime) -> Optional[DynamoData]:
+        """ Loads an unexpired session record, refreshing its `accessed` and `expires` attributes in the same request
+        while the idle timeout determines its expiration. See `SessionManager._dynamo_get`.
+        """
+        res = await self._dynamo_touch(session_id, current_dt)
+        return None if res is None else dynamo_data_from_item(res['Attributes'])
+
+    async def _dynamo_touch(self, session_id, current_dt: datetime,
+                            return_values: str = 'ALL_NEW') -> Optional[Dict[str, Any]]:
+        """ See `SessionManager._dynamo_touch`. """
+        client = await self.boto_client()
+        try:
+            return await client.update_item(**self._touch_request(session_id, current_dt, return_values))
+        except client.exceptions.ConditionalCheckFailedException:
+            pass
+        item = (await client.get_item(**self._read_request(session_id))).get('Item')
+        return None if item is None else await self._dynamo_refresh(item, session_id, current_dt, return_values)
+
+    async def _dynamo_refresh(self, item: Dict[str, Any], session_id, current_dt: datetime,
+                              return_values: str) -> Optional[Dict[str, Any]]:
+        """ See `SessionManager._dynamo_refresh`. """
+        client = await self.boto_client()
+        request = self._refresh_request(item, session_id, current_dt, return_values)
+        if request is None:
+            return None
+        try:
+            return await client.update_item(**request)
+        except client.exceptions.ConditionalCheckFailedException:
+            pass
+        return await self._dynamo_touch(session_id, current_dt, return_values)
+
+    async def _dynamo_set(self, data: DynamoData, session_id, current_dt: datetime):
+        client = await self.boto_client()
+        await client.update_item(**self._save_request(data, session_id, current_dt))
+
+    async def boto_client(self):
+        # Always looked up, rather than cached on the instance, since the client depends on the running event loop
+        return await shared_aio_client(self.endpoint_url, self.region_name)
@@ -0,0 +1,30 @@
+""" JSON serialization for the built-in session types, using the fastest library installed: orjson, then ujson, then
+the standard library. Serialized data is always bytes, which orjson produces without decoding.
+"""
+from typing import Any
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:  # pragma: no cover
+    try:
+        import ujson
+
+        def json_dumps(obj: Any) -> bytes:
+            return ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+        def json_loads(data: bytes) -> Any:
+            return ujson.loads(data)
+    except ImportError:
+        import json
+
+        def json_dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode('utf-8')
+
+        def json_loads(data: bytes) -> Any:
+            return json.loads(data)
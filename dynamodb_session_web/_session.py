@@ -1,45 +1,162 @@
 import hashlib
-import json
+import hmac
+import logging
+import os
+import threading
+import zlib
+from copy import deepcopy
 from abc import ABC, abstractmethod
+from base64 import urlsafe_b64encode
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from secrets import token_urlsafe
-from typing import Any, Generic, List, NamedTuple, Optional, Type, TypeVar, overload
+from functools import lru_cache, partial
+from secrets import token_bytes
+from time import sleep
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Set, Tuple, Type, TypeVar, Union, overload
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from itsdangerous import BadSignature, Signer
+from itsdangerous.signer import HMACAlgorithm
 
-from .exceptions import InvalidSessionIdError, SessionNotFoundError
+from ._json import json_dumps, json_loads
+from .exceptions import BatchLoadError, InvalidSessionIdError, SessionNotFoundError
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
 
 
 DEFAULT_IDLE_TIMEOUT = 7200  # two hours
 DEFAULT_ABSOLUTE_TIMEOUT = 43200  # twelve hours
 DEFAULT_TABLE = 'app_session'
 DEFAULT_SESSION_ID_BYTES = 32
+PAYLOAD_COMPRESSION_THRESHOLD = 4096  # bytes
+PAYLOAD_UNCOMPRESSED = b'\x00'
+PAYLOAD_ZLIB = b'\x01'
+PAYLOAD_ZSTD = b'\x02'
+COMPRESSION_CODECS = ('zlib', 'zstd')
+DEFAULT_COMPRESSION = 'zlib'
+BATCH_GET_MAX_KEYS = 100  # DynamoDB limit for a single BatchGetItem request
+BATCH_GET_BACKOFF_SECONDS = 0.05
+BATCH_GET_MAX_BACKOFF_SECONDS = 2.0
+BATCH_GET_MAX_ATTEMPTS = 8
+DEFAULT_TOUCH_INTERVAL = 60  # one minute
 
 T = TypeVar('T', bound='SessionInstanceBase')  # pylint: disable=invalid-name
 
-
-class DynamoData(NamedTuple):
-    data: Any
-    idle_timeout: int
-    absolute_timeout: int
-    created: str
-
-
-def create_session_id(byte_length: int, keys: List[str]) -> str:
-    if len(keys) > 0:
-        signer = Signer(keys)
-        return signer.sign(token_urlsafe(byte_length)).decode('utf-8')
-    return token_urlsafe(byte_length)
-
-
-def validate_session_id(session_id, keys: List[str]) -> None:
+BOTO_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    # Requests are only built by this package, so validating their parameters on every call is wasted work
+    parameter_validation=False,
+)
+
+logger = logging.getLogger(__name__)
+
+_boto_clients: Dict[Tuple[Optional[str], ...], Any] = {}
+_boto_clients_lock = threading.Lock()
+
+# Sessions with a background touch queued or running, by table name and session ID
+_touches_in_flight: Set[Tuple[str, str]] = set()
+_touches_in_flight_lock = threading.Lock()
+
+
+class DynamoData:  # pylint: disable=too-few-public-methods
+    """ The stored attributes of a session record, which are read on every load and save. """
+    __slots__ = ('data', 'created', 'idle_timeout', 'absolute_timeout', 'accessed')
+
+    def __init__(self, data: Any, created: int, idle_timeout: int, absolute_timeout: int, accessed: int = 0) -> None:
+        self.data = data
+        self.created = created
+        self.idle_timeout = idle_timeout
+        self.absolute_timeout = absolute_timeout
+        self.accessed = accessed
+
+
+def encode_payload(data: Union[str, bytes], compression: str = DEFAULT_COMPRESSION) -> bytes:
+    """ Encodes serialized session data for the binary `data` attribute. The first byte of the result records whether
+    and how the rest is compressed, which only happens once the data is large enough to benefit, using the
+    `compression` codec ('zlib' or 'zstd').
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if len(data) > PAYLOAD_COMPRESSION_THRESHOLD:
+        if compression == 'zstd':
+            return PAYLOAD_ZSTD + zstandard.compress(data)
+        return PAYLOAD_ZLIB + zlib.compress(data)
+    return PAYLOAD_UNCOMPRESSED + data
+
+
+def decode_payload(payload: bytes) -> bytes:
+    prefix = payload[:1]
+    if prefix == PAYLOAD_ZSTD:
+        if zstandard is None:  # pragma: no cover
+            raise RuntimeError('Session data is compressed with Zstandard, which is not installed')
+        return zstandard.decompress(payload[1:])
+    if prefix == PAYLOAD_ZLIB:
+        return zlib.decompress(payload[1:])
+    return payload[1:]
+
+
+def dynamo_data_from_item(item: Dict[str, Any]) -> DynamoData:
+    data = item['data']
+    # Records saved by earlier versions store data as a string
+    created = item['created']
+    return DynamoData(decode_payload(data['B']) if 'B' in data else data['S'].encode('utf-8'),
+                      int(created['N']) if 'N' in created else int(datetime.fromisoformat(created['S']).timestamp()),
+                      int(item['idle_timeout']['N']),
+                      int(item['absolute_timeout']['N']),
+                      int(datetime.fromisoformat(item['accessed']['S']).timestamp()))
+
+
+class HMACDigestAlgorithm(HMACAlgorithm):
+    """ Produces the same signatures as `HMACAlgorithm`, using the one-shot `hmac.digest` instead of creating an HMAC
+    object for every signature.
+    """
+
+    def __init__(self, digest_method: Any = None) -> None:
+        super().__init__(digest_method)
+        # Before Python 3.9, `hmac.digest` only uses OpenSSL's one-shot HMAC for a digest name, not a constructor
+        self.digest_name: str = self.digest_method().name
+
+    def get_signature(self, key: bytes, value: bytes) -> bytes:
+        return hmac.digest(key, value, self.digest_name)
+
+
+class SessionIdSigner(Signer):
+    """ A `Signer` for session IDs, which produces the same signatures as a default `Signer` with the same keys, but
+    derives each key once rather than for every signature, and signs with `HMACDigestAlgorithm`.
+    """
+
+    def __init__(self, secret_keys: Union[str, bytes, Iterable[str], Iterable[bytes]]) -> None:
+        super().__init__(secret_keys, digest_method=hashlib.sha1, algorithm=HMACDigestAlgorithm(hashlib.sha1))
+        self._derived_keys: Dict[Union[str, bytes, None], bytes] = {}
+
+    def derive_key(self, secret_key: Union[str, bytes, None] = None) -> bytes:
+        derived_key = self._derived_keys.get(secret_key)
+        if derived_key is None:
+            derived_key = self._derived_keys[secret_key] = super().derive_key(secret_key)
+        return derived_key
+
+
+def create_session_id(byte_length: int, signer: Optional[Signer] = None) -> str:
+    # Equivalent to `token_urlsafe`, but slices off the padding, since its length is known, instead of stripping it
+    session_id = urlsafe_b64encode(token_bytes(byte_length))[:(byte_length * 4 + 2) // 3]
+    if signer is not None:
+        return signer.sign(session_id).decode('ascii')
+    return session_id.decode('ascii')
+
+
+def validate_session_id(session_id, signer: Optional[Signer] = None) -> None:
     if not session_id:
         raise SessionNotFoundError(loggable_session_id(''))
 
-    if len(keys) > 0:
-        signer = Signer(keys)
-        signer.unsign(session_id).decode('utf-8')
+    if signer is not None:
+        signer.unsign(session_id)
 
 
 def current_datetime(datetime_value: Optional[datetime] = None) -> datetime:
@@ -61,52 +178,189 @@ def expiration_datetime(idle_timeout: int, absolute_timeout: int, created: str,
     if accessed_dt.tzname() != 'UTC':
         raise ValueError("'accessed' must be UTC ")
 
-    absolute_expiration = absolute_timeout + int(created_dt.timestamp())
-    idle_expiration = idle_timeout + int(accessed_dt.timestamp())
+    return expiration_timestamp(idle_timeout, absolute_timeout, int(created_dt.timestamp()),
+                                int(accessed_dt.timestamp()))
+
+
+def expiration_timestamp(idle_timeout: int, absolute_timeout: int, created: int, accessed: int) -> int:
+    return min(absolute_timeout + created, idle_timeout + accessed)
+
+
+def idle_cutoff_timestamp(idle_timeout: int, absolute_timeout: int, created: int) -> int:
+    """ The latest timestamp at which an access still extends expiration by the full idle timeout. After this point,
+    the absolute timeout determines expiration.
+    """
+    return created + absolute_timeout - idle_timeout
+
+
+def boto_client_kwargs(endpoint_url: Optional[str], region_name: Optional[str]) -> Dict[str, str]:
+    kwargs = {}
+    if endpoint_url is not None:
+        kwargs["endpoint_url"] = endpoint_url
+    if region_name is not None:
+        kwargs["region_name"] = region_name
+    return kwargs
+
+
+@lru_cache(maxsize=None)
+def _boto_session():
+    # Created on first use, since building a session loads botocore's configuration
+    return boto3.session.Session()
+
+
+def _shared_client(key: Tuple[Optional[str], ...], create_client: Callable[[], Any]):
+    client = _boto_clients.get(key)
+    if client is None:
+        # boto3 sessions aren't thread safe, so clients are created one at a time
+        with _boto_clients_lock:
+            client = _boto_clients.get(key)
+            if client is None:
+                client = create_client()
+                _boto_clients[key] = client
+    return client
+
+
+def shared_boto_client(endpoint_url: Optional[str], region_name: Optional[str]):
+    """ Returns a DynamoDB client shared by every caller using the same endpoint and region. Creating a client loads
+    the service model and builds a new connection pool, which is expensive when session managers are short-lived.
+    """
+    return _shared_client((endpoint_url, region_name),
+                          lambda: _boto_session().client('dynamodb', config=BOTO_CLIENT_CONFIG,
+                                                         **boto_client_kwargs(endpoint_url, region_name)))
+
+
+def shared_dax_client(dax_endpoint_url: str, region_name: Optional[str]):
+    """ Returns a DynamoDB Accelerator (DAX) client shared by every caller using the same cluster and region. """
+    def create_client():
+        # amazon-dax-client is an optional dependency, only needed when a DAX endpoint is configured
+        from amazondax import AmazonDaxClient  # pylint: disable=import-outside-toplevel
+        return AmazonDaxClient(session=_boto_session(), region_name=region_name, endpoint_url=dax_endpoint_url)
 
-    return min(absolute_expiration, idle_expiration)
+    return _shared_client(('dax', dax_endpoint_url, region_name), create_client)
+
+
+@lru_cache(maxsize=None)
+def _touch_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4),
+                              thread_name_prefix='dynamodb-session-touch')
+
+
+def _finish_touch(key: Tuple[str, str], future: 'Future[Any]') -> None:
+    with _touches_in_flight_lock:
+        _touches_in_flight.discard(key)
+    exc = future.exception()
+    if exc is not None:
+        logger.warning('Failed to refresh session in the background', exc_info=exc)
+
+
+def is_conditional_check_failure(exc: ClientError) -> bool:
+    return exc.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException'
 
 
 def loggable_session_id(sid: str) -> str:
-    return hashlib.sha512(sid.encode()).hexdigest()
+    """ Hashes a session ID so it can be logged without exposing it. The hash only needs to be an opaque, consistent
+    identifier, so it uses a 128-bit BLAKE2b digest, which is faster than SHA-512 for inputs this short.
+    """
+    return hashlib.blake2b(sid.encode(), digest_size=16).hexdigest()
 
 
 class SessionInstanceBase(ABC):
+    # Empty so subclasses can choose whether instances have a `__dict__`; a non-empty layout here couldn't be combined
+    # with `dict` in `SessionDictInstance`. Subclasses that use slots need to declare `INSTANCE_SLOTS`.
+    __slots__ = ()
+    INSTANCE_SLOTS = ('session_id', 'idle_timeout_seconds', 'absolute_timeout_seconds', 'created',
+                      '_loggable_session_id')
+
+    session_id: str
+    idle_timeout_seconds: int
+    absolute_timeout_seconds: int
+    created: datetime
+    _loggable_session_id: Optional[Tuple[str, str]]
+
     def __init__(self, *,
                  session_id: str = '',
                  idle_timeout_seconds: int = DEFAULT_IDLE_TIMEOUT,
                  absolute_timeout_seconds: int = DEFAULT_ABSOLUTE_TIMEOUT,
                  created: Optional[datetime] = None):
-        self.session_id = session_id
-        self.idle_timeout_seconds = int(idle_timeout_seconds)
-        self.absolute_timeout_seconds = int(absolute_timeout_seconds)
-        self.created = current_datetime() if created is None else created
+        self.session_id = session_id  # type: ignore[misc]
+        self.idle_timeout_seconds = int(idle_timeout_seconds)  # type: ignore[misc]
+        self.absolute_timeout_seconds = int(absolute_timeout_seconds)  # type: ignore[misc]
+        self.created = current_datetime() if created is None else created  # type: ignore[misc]
+        self._loggable_session_id = None  # type: ignore[misc]
 
     @abstractmethod
-    def deserialize(self, data: str):
+    def deserialize(self, data: bytes):
         pass
 
     @abstractmethod
-    def serialize(self) -> str:
+    def serialize(self) -> Union[str, bytes]:
         pass
 
     @property
     def loggable_session_id(self):
-        return loggable_session_id(self.session_id)
+        # Cached with the session ID it was computed from, since `session_id` can be reassigned
+        if self._loggable_session_id is None or self._loggable_session_id[0] != self.session_id:
+            self._loggable_session_id = (self.session_id, loggable_session_id(self.session_id))
+        return self._loggable_session_id[1]
 
 
 class SessionDictInstance(SessionInstanceBase, dict):
+    # `__dict__` is kept, though only allocated when used, so arbitrary attributes can still be set on instances
+    __slots__ = SessionInstanceBase.INSTANCE_SLOTS + ('__dict__',)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def deserialize(self, data: bytes):
+        self.update(json_loads(data))
+
+    def serialize(self) -> bytes:
+        return json_dumps(self)
+
+
+class TypedSessionInstance(SessionInstanceBase):
+    """ A session instance with a fixed set of fields, declared as annotated class attributes with default values:
+
+        class MySession(TypedSessionInstance):
+            fruit: str = ''
+            color: str = ''
+
+    Only the declared fields are serialized, and deserializing assigns them directly, without keeping the decoded
+    dictionary. Mutable defaults, such as lists, are copied for each instance, so instances never share them.
+    """
+    _fields: Tuple[str, ...] = ()
+    _mutable_fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields: Dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            if issubclass(klass, TypedSessionInstance):
+                fields.update(dict.fromkeys(name for name in vars(klass).get('__annotations__', {})
+                                            if not name.startswith('_')))
+        cls._fields = tuple(fields)
+        # Unhashable defaults are the mutable ones, as in `dataclasses`; immutable defaults are shared safely
+        cls._mutable_fields = tuple(name for name in cls._fields
+                                    if type(getattr(cls, name, None)).__hash__ is None)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        for name in self._mutable_fields:
+            setattr(self, name, deepcopy(getattr(type(self), name)))
 
-    def deserialize(self, data: str):
-        self.update(json.loads(data))
+    def deserialize(self, data: bytes):
+        values = json_loads(data)
+        for name in self._fields:
+            if name in values:
+                setattr(self, name, values[name])
 
-    def serialize(self) -> str:
-        return json.dumps(self)
+    def serialize(self) -> bytes:
+        return json_dumps({name: getattr(self, name) for name in self._fields})
 
 
 class NullSessionInstance(SessionInstanceBase):
+    __slots__ = SessionInstanceBase.INSTANCE_SLOTS
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -117,41 +371,48 @@ class NullSessionInstance(SessionInstanceBase):
         pass
 
 
-class SessionManager(Generic[T]):  # pylint: disable=too-many-instance-attributes
-    _boto_client = None
+class SessionManagerBase(Generic[T]):  # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    """ Configuration and request building shared by the synchronous and asynchronous session managers, which only
+    differ in how they send requests to DynamoDB.
+    """
     _data_type: Type[T]
     _idle_timeout: int = DEFAULT_IDLE_TIMEOUT
     _absolute_timeout: int = DEFAULT_ABSOLUTE_TIMEOUT
     _sid_keys: List[str] = []
+    _consistent_reads = True
 
     null_session_class: Type[SessionInstanceBase] = NullSessionInstance
 
-    @overload
-    def __init__(self: 'SessionManager[SessionDictInstance]', **kwargs) -> None:  # pragma: no cover
-        self.sid_byte_length = kwargs.get('sid_byte_length', DEFAULT_SESSION_ID_BYTES)
-        self.table_name = kwargs.get('table_name', DEFAULT_TABLE)
-        self.endpoint_url = kwargs.get('endpoint_url', None)
-        self.region_name = kwargs.get('region_name', None)
-        self._idle_timeout = kwargs.get('idle_timeout', DEFAULT_IDLE_TIMEOUT)
-        self._absolute_timeout = kwargs.get('absolute_timeout', DEFAULT_ABSOLUTE_TIMEOUT)
-        self._sid_keys = kwargs.get('sid_keys', [])
-        self._bad_session_id_raises = kwargs.get('bad_session_id_raises', False)
-        self._data_type = SessionDictInstance
-
-    @overload
-    def __init__(self: 'SessionManager[T]', data_type: Type[T], **kwargs) -> None:  # pragma: no cover
-        self.sid_byte_length = kwargs.get('sid_byte_length', DEFAULT_SESSION_ID_BYTES)
-        self.table_name = kwargs.get('table_name', DEFAULT_TABLE)
-        self.endpoint_url = kwargs.get('endpoint_url', None)
-        self.region_name = kwargs.get('region_name', None)
-        self._idle_timeout = kwargs.get('idle_timeout', DEFAULT_IDLE_TIMEOUT)
-        self._absolute_timeout = kwargs.get('absolute_timeout', DEFAULT_ABSOLUTE_TIMEOUT)
-        self._sid_keys = kwargs.get('sid_keys', [])
-        self._bad_session_id_raises = kwargs.get('bad_session_id_raises', False)
-        self._data_type = data_type
+    # Request expressions never change, so they're built once rather than per request.
+    _SAVE_ATTRIBUTE_NAMES = {
+        '#accessed': 'accessed',
+        '#expires': 'expires',
+        '#idle_cutoff': 'idle_cutoff',
+        '#created': 'created',
+        '#idle_timeout': 'idle_timeout',
+        '#absolute_timeout': 'absolute_timeout',
+        '#data': 'data',
+    }
+    # `created` is written with `expires` and `idle_cutoff`, which are computed from the instance's value of it
+    _SAVE_UPDATE_EXPRESSION = ('SET #accessed = :accessed, #expires = :expires, #idle_cutoff = :idle_cutoff, '
+                               '#created = :created, #idle_timeout = :idle_timeout, '
+                               '#absolute_timeout = :absolute_timeout, #data = :data')
+
+    _TOUCH_ATTRIBUTE_NAMES = {
+        '#accessed': 'accessed',
+        '#expires': 'expires',
+        '#idle_cutoff': 'idle_cutoff',
+        '#idle_timeout': 'idle_timeout',
+    }
+    _TOUCH_IDLE_UPDATE_EXPRESSION = 'SET #accessed = :accessed, #expires = :now + #idle_timeout'
+    _TOUCH_IDLE_CONDITION = '#expires > :now AND #idle_cutoff >= :now'
+    _TOUCH_ABSOLUTE_UPDATE_EXPRESSION = 'SET #accessed = :accessed, #expires = #idle_cutoff + #idle_timeout'
+    _TOUCH_ABSOLUTE_CONDITION = '#expires > :now AND attribute_exists(#idle_cutoff)'
+    # Records saved by earlier versions have no `idle_cutoff`, so they're rewritten in full once, like a save
+    _UPGRADE_CONDITION = 'attribute_not_exists(#idle_cutoff)'
 
     def __init__(self, data_type: Type[T] = SessionDictInstance, **kwargs) -> None:  # type: ignore
-        """ Creates a new SessionManager instance.
+        """ Creates a new session manager instance.
 
         :param data_type: The data type to use for session instances. Defaults to SessionDictInstance.
         :param kwargs: Supported keyword args:
@@ -161,6 +422,12 @@ class SessionManager(Generic[T]):  # pylint: disable=too-many-instance-attribute
             region_name - The DynamoDB Region. Defaults to None.
             idle_timeout - The timeout used to expire idle sessions. Defaults to 7200 seconds.
             absolute_timeout - The timeout used for absolute session expiration. Defaults to 43200 seconds.
+            touch_interval_seconds - Loading a session that was last refreshed or saved less than this many seconds ago
+                (or a tenth of its idle timeout, if shorter) doesn't refresh it again, saving a write. Set to 0 to
+                refresh on every load, using a single `UpdateItem` request while the session's idle timeout
+                determines its expiration. Defaults to 60 seconds.
+            compression - The codec compressing large session data, 'zlib' or 'zstd'. 'zstd' requires the zstd extra,
+                in every application reading the sessions. Defaults to 'zlib'.
         """
         self.sid_byte_length = kwargs.get('sid_byte_length', DEFAULT_SESSION_ID_BYTES)
         self.table_name = kwargs.get('table_name', DEFAULT_TABLE)
@@ -169,7 +436,15 @@ class SessionManager(Generic[T]):  # pylint: disable=too-many-instance-attribute
         self._idle_timeout = kwargs.get('idle_timeout_seconds', DEFAULT_IDLE_TIMEOUT)
         self._absolute_timeout = kwargs.get('absolute_timeout_seconds', DEFAULT_ABSOLUTE_TIMEOUT)
         self._sid_keys = kwargs.get('sid_keys', [])
+        # Built once, rather than for every session ID created or validated
+        self._signer = SessionIdSigner(self._sid_keys) if self._sid_keys else None
         self._bad_session_id_raises = kwargs.get('bad_session_id_raises', False)
+        self._touch_interval = kwargs.get('touch_interval_seconds', DEFAULT_TOUCH_INTERVAL)
+        self._compression = kwargs.get('compression', DEFAULT_COMPRESSION)
+        if self._compression not in COMPRESSION_CODECS:
+            raise ValueError(f'Unsupported compression: {self._compression}')
+        if self._compression == 'zstd' and zstandard is None:
+            raise ValueError("'zstd' compression requires the zstandard package (the zstd extra)")
         self._data_type = data_type
 
     def create(self, *,
@@ -187,10 +462,180 @@ class SessionManager(Generic[T]):  # pylint: disable=too-many-instance-attribute
         """
         idle = self._idle_timeout if idle_timeout_seconds is None else idle_timeout_seconds
         absolute = self._absolute_timeout if absolute_timeout_seconds is None else absolute_timeout_seconds
-        return self._data_type(session_id=create_session_id(self.sid_byte_length, self._sid_keys),
+        return self._data_type(session_id=create_session_id(self.sid_byte_length, self._signer),
                                idle_timeout_seconds=idle,
                                absolute_timeout_seconds=absolute)
 
+    def _is_loadable_session_id(self, session_id) -> bool:
+        """ Checks a session ID before loading it. A badly signed ID is only an error when the manager is configured to
+        raise; otherwise, it's treated like an unknown session.
+        """
+        try:
+            validate_session_id(session_id, self._signer)
+        except BadSignature as exc:
+            if self._bad_session_id_raises:
+                raise InvalidSessionIdError(loggable_session_id(session_id)) from exc
+            return False
+        return True
+
+    def _loaded_session(self, session_id, data: Optional[DynamoData]) -> T:
+        if data is None:
+            if self._bad_session_id_raises:
+                raise SessionNotFoundError(loggable_session_id(session_id))
+            return self.null_session_class(session_id=session_id)  # type: ignore
+
+        return self._session_instance(session_id, data)
+
+    def _needs_touch(self, data: DynamoData, now: int) -> bool:
+        # Capped relative to the idle timeout, since skipping a refresh lets the session expire that much earlier
+        return now - data.accessed >= min(self._touch_interval, data.idle_timeout // 10)
+
+    def _session_instance(self, session_id, data: DynamoData) -> T:
+        session_object = self._data_type(session_id=session_id,
+                                         idle_timeout_seconds=data.idle_timeout,
+                                         absolute_timeout_seconds=data.absolute_timeout,
+                                         created=datetime.fromtimestamp(data.created, tz=timezone.utc))
+        session_object.deserialize(data.data)
+        return session_object
+
+    def _batch_load_ids(self, session_ids: List[str]) -> List[List[str]]:
+        """ Drops duplicate and invalid session IDs, and splits the rest into `BatchGetItem` sized chunks. """
+        valid_ids = []
+        for session_id in dict.fromkeys(session_ids):
+            try:
+                validate_session_id(session_id, self._signer)
+            except (BadSignature, SessionNotFoundError):
+                continue
+            valid_ids.append(session_id)
+        return [valid_ids[start:start + BATCH_GET_MAX_KEYS] for start in range(0, len(valid_ids), BATCH_GET_MAX_KEYS)]
+
+    def _batch_loaded_sessions(self, items: List[Dict[str, Any]], now: int) -> Dict[str, T]:
+        sessions = {}
+        for item in items:
+            if int(item['expires']['N']) > now:
+                session_id = item['id']['S']
+                sessions[session_id] = self._session_instance(session_id, dynamo_data_from_item(item))
+        return sessions
+
+    @staticmethod
+    def _dynamo_data(data: SessionInstanceBase) -> DynamoData:
+        return DynamoData(data.serialize(),
+                          int(data.created.timestamp()),
+                          data.idle_timeout_seconds,
+                          data.absolute_timeout_seconds)
+
+    def _read_request(self, session_id) -> Dict[str, Any]:
+        return {
+            'TableName': self.table_name,
+            'Key': {'id': {'S': session_id}},
+            'ConsistentRead': self._consistent_reads,
+        }
+
+    def _touch_request(self, session_id, current_dt: datetime, return_values: str = 'ALL_NEW',
+                       idle: bool = True) -> Dict[str, Any]:
+        """ Builds the request that refreshes a session record while the idle timeout determines its expiration, or,
+        when `idle` is False, once it's past its `idle_cutoff`.
+        """
+        return {
+            'TableName': self.table_name,
+            'Key': {'id': {'S': session_id}},
+            'UpdateExpression': self._TOUCH_IDLE_UPDATE_EXPRESSION if idle else self._TOUCH_ABSOLUTE_UPDATE_EXPRESSION,
+            'ConditionExpression': self._TOUCH_IDLE_CONDITION if idle else self._TOUCH_ABSOLUTE_CONDITION,
+            'ExpressionAttributeNames': self._TOUCH_ATTRIBUTE_NAMES,
+            'ExpressionAttributeValues': {
+                ':accessed': {'S': current_dt.isoformat()},
+                ':now': {'N': str(int(current_dt.timestamp()))},
+            },
+            'ReturnValues': return_values,
+        }
+
+    def _save_request(self, data: DynamoData, session_id, current_dt: datetime) -> Dict[str, Any]:
+        attr_values = {
+            ':accessed': {'S': current_dt.isoformat()},
+            ':expires': {'N': str(expiration_timestamp(data.idle_timeout, data.absolute_timeout, data.created,
+                                                       int(current_dt.timestamp())))},
+            ':idle_cutoff': {'N': str(idle_cutoff_timestamp(data.idle_timeout, data.absolute_timeout, data.created))},
+            ':created': {'N': str(data.created)},
+            ':idle_timeout': {'N': str(data.idle_timeout)},
+            ':absolute_timeout': {'N': str(data.absolute_timeout)},
+            ':data': {'B': encode_payload(data.data, self._compression)},
+        }
+        return {
+            'TableName': self.table_name,
+            'Key': {'id': {'S': session_id}},
+            'ExpressionAttributeNames': self._SAVE_ATTRIBUTE_NAMES,
+            'ExpressionAttributeValues': attr_values,
+            'UpdateExpression': self._SAVE_UPDATE_EXPRESSION,
+            'ReturnValues': 'NONE',
+        }
+
+    def _refresh_request(self, item: Dict[str, Any], session_id, current_dt: datetime,
+                         return_values: str) -> Optional[Dict[str, Any]]:
+        """ Builds the one request that refreshes the session record `item`, already read: the touch for whichever
+        timeout determines its expiration, or, for a record saved by an earlier version, which the touch conditions
+        never match since it has no `idle_cutoff` attribute, a rewrite like a save. Returns None for an expired record.
+        """
+        now = int(current_dt.timestamp())
+        if int(item['expires']['N']) <= now:
+            return None
+        if 'idle_cutoff' in item:
+            return self._touch_request(session_id, current_dt, return_values, int(item['idle_cutoff']['N']) >= now)
+        return {
+            **self._save_request(dynamo_data_from_item(item), session_id, current_dt),
+            'ConditionExpression': self._UPGRADE_CONDITION,
+            'ReturnValues': return_values,
+        }
+
+    def _batch_get_request_items(self, session_ids: List[str]) -> Dict[str, Any]:
+        return {self.table_name: {
+            'Keys': [{'id': {'S': session_id}} for session_id in session_ids],
+            'ConsistentRead': self._consistent_reads,
+        }}
+
+
+class SessionManager(SessionManagerBase[T]):  # pylint: disable=too-many-instance-attributes
+    _boto_client = None
+
+    @overload
+    def __init__(self: 'SessionManager[SessionDictInstance]', **kwargs) -> None:  # pragma: no cover
+        self.sid_byte_length = kwargs.get('sid_byte_length', DEFAULT_SESSION_ID_BYTES)
+        self.table_name = kwargs.get('table_name', DEFAULT_TABLE)
+        self.endpoint_url = kwargs.get('endpoint_url', None)
+        self.region_name = kwargs.get('region_name', None)
+        self._idle_timeout = kwargs.get('idle_timeout', DEFAULT_IDLE_TIMEOUT)
+        self._absolute_timeout = kwargs.get('absolute_timeout', DEFAULT_ABSOLUTE_TIMEOUT)
+        self._sid_keys = kwargs.get('sid_keys', [])
+        self._bad_session_id_raises = kwargs.get('bad_session_id_raises', False)
+        self._data_type = SessionDictInstance
+
+    @overload
+    def __init__(self: 'SessionManager[T]', data_type: Type[T], **kwargs) -> None:  # pragma: no cover
+        self.sid_byte_length = kwargs.get('sid_byte_length', DEFAULT_SESSION_ID_BYTES)
+        self.table_name = kwargs.get('table_name', DEFAULT_TABLE)
+        self.endpoint_url = kwargs.get('endpoint_url', None)
+        self.region_name = kwargs.get('region_name', None)
+        self._idle_timeout = kwargs.get('idle_timeout', DEFAULT_IDLE_TIMEOUT)
+        self._absolute_timeout = kwargs.get('absolute_timeout', DEFAULT_ABSOLUTE_TIMEOUT)
+        self._sid_keys = kwargs.get('sid_keys', [])
+        self._bad_session_id_raises = kwargs.get('bad_session_id_raises', False)
+        self._data_type = data_type
+
+    def __init__(self, data_type: Type[T] = SessionDictInstance, **kwargs) -> None:  # type: ignore
+        """ Creates a new SessionManager instance.
+
+        :param data_type: The data type to use for session instances. Defaults to SessionDictInstance.
+        :param kwargs: See `SessionManagerBase`. Also supports:
+            dax_endpoint_url - A DynamoDB Accelerator (DAX) cluster endpoint to send requests to, instead of DynamoDB.
+                Reads that don't refresh the session are then eventually consistent, so DAX can serve them from its
+                cache. Defaults to None.
+            touch_in_background - Refresh loaded sessions from a background thread, so the refresh isn't part of
+                the load's latency. Defaults to False.
+        """
+        super().__init__(data_type, **kwargs)
+        self.dax_endpoint_url = kwargs.get('dax_endpoint_url', None)
+        self._touch_in_background = kwargs.get('touch_in_background', False)
+        self._consistent_reads = self.dax_endpoint_url is None
+
     def create_and_save(self, *,
                         idle_timeout_seconds: Optional[int] = None,
                         absolute_timeout_seconds: Optional[int] = None) -> T:
@@ -204,49 +649,39 @@ class SessionManager(Generic[T]):  # pylint: disable=too-many-instance-attribute
 
         :return: A new session instance
         """
-        idle = self._idle_timeout if idle_timeout_seconds is None else idle_timeout_seconds
-        absolute = self._absolute_timeout if absolute_timeout_seconds is None else absolute_timeout_seconds
-        sid = create_session_id(self.sid_byte_length, self._sid_keys)
-        session_data_object = self._data_type(session_id=sid,
-                                              idle_timeout_seconds=idle,
-                                              absolute_timeout_seconds=absolute)
-
-        dynamo_data = DynamoData(session_data_object.serialize(),
-                                 session_data_object.idle_timeout_seconds,
-                                 session_data_object.absolute_timeout_seconds,
-                                 current_datetime().isoformat())
-        self._dynamo_set(dynamo_data, sid, modified=True)
+        session_data_object = self.create(idle_timeout_seconds=idle_timeout_seconds,
+                                          absolute_timeout_seconds=absolute_timeout_seconds)
+        # The new instance's creation time doubles as its save time
+        self._save(session_data_object, session_data_object.created)
         return session_data_object
 
     def load(self, session_id) -> T:
-        data = None
-        try:
-            validate_session_id(session_id, self._sid_keys)
-        except BadSignature as exc:
-            if self._bad_session_id_raises:
-                raise InvalidSessionIdError(loggable_session_id(session_id)) from exc
-        else:
-            data = self._perform_get(session_id)
-            if data is None and self._bad_session_id_raises:
-                raise SessionNotFoundError(loggable_session_id(session_id))
+        data = self._perform_get(session_id) if self._is_loadable_session_id(session_id) else None
+        return self._loaded_session(session_id, data)
 
-        if data is None:
-            return self.null_session_class(session_id=session_id)  # type: ignore
+    def batch_load(self, session_ids: List[str]) -> Dict[str, T]:
+        """ Loads multiple sessions using as few `BatchGetItem` requests as possible.
 
-        self._dynamo_set(data, session_id, modified=False)
-        session_object = self._data_type(session_id=session_id,
-                                         idle_timeout_seconds=data.idle_timeout,
-                                         absolute_timeout_seconds=data.absolute_timeout,
-                                         created=datetime.fromisoformat(data.created))
-        session_object.deserialize(data.data)
-        return session_object
+        Unlike `load`, this does not refresh the `accessed` and `expires` attributes of the loaded sessions.
+
+        :param session_ids: The session IDs to load.
+
+        :return: A dictionary of session ID to session instance. Invalid, unknown, and expired session IDs are omitted.
+
+        :raises BatchLoadError: If DynamoDB doesn't process some of the session IDs within `BATCH_GET_MAX_ATTEMPTS`
+        requests.
+        """
+        now = current_timestamp()
+        sessions = {}
+        for chunk in self._batch_load_ids(session_ids):
+            sessions.update(self._batch_loaded_sessions(self._dynamo_batch_get(chunk), now))
+        return sessions
 
     def save(self, data: T):
-        dynamo_data = DynamoData(data.serialize(),
-                                 data.idle_timeout_seconds,
-                                 data.absolute_timeout_seconds,
-                                 data.created.isoformat())
-        self._dynamo_set(dynamo_data, data.session_id, modified=True)
+        self._save(data, current_datetime())
+
+    def _save(self, data: T, current_dt: datetime):
+        self._dynamo_set(self._dynamo_data(data), data.session_id, current_dt)
 
     def clear(self, session_id):
         self._dynamo_remove(session_id)
@@ -257,70 +692,114 @@ class SessionManager(Generic[T]):  # pylint: disable=too-many-instance-attribute
             Key={'id': {'S': session_id}})
 
     def _perform_get(self, session_id) -> Optional[DynamoData]:
-        return self._dynamo_get(session_id)
-
-    def _dynamo_get(self, session_id) -> Optional[DynamoData]:
-        res = self.boto_client().query(TableName=self.table_name,
-                                       ExpressionAttributeValues={
-                                           ':sid': {
-                                               'S': session_id,
-                                           },
-                                           ':now': {
-                                               'N': str(current_timestamp())
-                                           },
-                                       },
-                                       KeyConditionExpression='id = :sid',
-                                       FilterExpression='expires > :now',
-                                       ConsistentRead=True)
-        if res.get('Items') and len(res.get('Items')) == 1:
-            idle_timeout = int(res.get('Items')[0]['idle_timeout'].get('N', self._idle_timeout))
-            absolute_timeout = int(res.get('Items')[0]['absolute_timeout'].get('N', self._absolute_timeout))
-            created: str = res.get('Items')[0]['created'].get('S', current_datetime().isoformat())
-
-            if res.get('Items')[0]['data']:
-                data = res.get('Items')[0]['data']
-                return DynamoData(data.get('S', '{}'), idle_timeout, absolute_timeout, created)
-
-        return None
-
-    def _dynamo_set(self, data: DynamoData, session_id, modified):
-        current_dt = current_datetime().isoformat()
-        fields = {
-            'accessed': {'S': current_dt},
-            'expires': {'N': str(
-                expiration_datetime(data.idle_timeout, data.absolute_timeout, data.created, current_dt)
-            )},
-            'created': {'S': data.created},
-        }
+        current_dt = current_datetime()
+        if self._touch_interval <= 0 and not self._touch_in_background:
+            return self._dynamo_get(session_id, current_dt)
+
+        now = int(current_dt.timestamp())
+        item = self._dynamo_read(session_id, now)
+        if item is None:
+            return None
+        data = dynamo_data_from_item(item)
+        if self._needs_touch(data, now):
+            if self._touch_in_background:
+                self._touch_in_background_once(item, session_id, current_dt)
+            else:
+                self._dynamo_refresh(item, session_id, current_dt, 'NONE')
+        return data
+
+    def _touch_in_background_once(self, item: Dict[str, Any], session_id, current_dt: datetime) -> None:
+        """ Queues a background touch, unless one is already queued or running for the session, so concurrent loads
+        don't each add one.
+        """
+        key = (self.table_name, session_id)
+        with _touches_in_flight_lock:
+            if key in _touches_in_flight:
+                return
+            _touches_in_flight.add(key)
+        try:
+            future = _touch_executor().submit(self._dynamo_refresh, item, session_id, current_dt, 'NONE')
+        except Exception:
+            with _touches_in_flight_lock:
+                _touches_in_flight.discard(key)
+            raise
+        future.add_done_callback(partial(_finish_touch, key))
+
+    def _dynamo_read(self, session_id, now: int) -> Optional[Dict[str, Any]]:
+        """ Loads an unexpired session record without refreshing it. """
+        item = self.boto_client().get_item(**self._read_request(session_id)).get('Item')
+        if item is None or int(item['expires']['N']) <= now:
+            return None
+        return item
+
+    def _dynamo_get(self, session_id, current_dt: datetime) -> Optional[DynamoData]:
+        """ Loads an unexpired session record, refreshing its `accessed` and `expires` attributes in the same request
+        while the idle timeout determines its expiration (see `_dynamo_touch`).
+        """
+        res = self._dynamo_touch(session_id, current_dt)
+        return None if res is None else dynamo_data_from_item(res['Attributes'])
+
+    def _dynamo_touch(self, session_id, current_dt: datetime,
+                      return_values: str = 'ALL_NEW') -> Optional[Dict[str, Any]]:
+        """ Refreshes the `accessed` and `expires` attributes of an unexpired session record.
+
+        DynamoDB can't compute `min()` in an update expression, so the single `UpdateItem` only succeeds while the idle
+        timeout determines expiration, which is the usual case. When its condition fails, the record is read, so a
+        missing or expired session costs one more request; any other record is refreshed by `_dynamo_refresh`. None is
+        returned for missing and expired sessions.
+        """
+        client = self.boto_client()
 
-        if modified:
-            fields['idle_timeout'] = {'N': str(data.idle_timeout)}
-            fields['absolute_timeout'] = {'N': str(data.absolute_timeout)}
-            fields['data'] = {'S': data.data}
-
-        attr_names = {}
-        attr_values = {}
-        update_expression = []
-        for key, val in fields.items():
-            attr = f'#attr_{key}'
-            token = f':{key}'
-            update_expression.append(f'{attr} = {token}')
-            attr_values[token] = val
-            attr_names[attr] = key
-
-        self.boto_client().update_item(TableName=self.table_name,
-                                       Key={'id': {'S': session_id}},
-                                       ExpressionAttributeNames=attr_names,
-                                       ExpressionAttributeValues=attr_values,
-                                       UpdateExpression=f'SET {", ".join(update_expression)}',
-                                       ReturnValues='NONE')
+        # Failed conditions are checked by error code, since DAX clients don't have modeled exception classes
+        try:
+            return client.update_item(**self._touch_request(session_id, current_dt, return_values))
+        except ClientError as exc:
+            if not is_conditional_check_failure(exc):
+                raise
+        item = client.get_item(**self._read_request(session_id)).get('Item')
+        return None if item is None else self._dynamo_refresh(item, session_id, current_dt, return_values)
+
+    def _dynamo_refresh(self, item: Dict[str, Any], session_id, current_dt: datetime,
+                        return_values: str) -> Optional[Dict[str, Any]]:
+        """ Refreshes the session record `item`, already read, with the single request that matches it (see
+        `_refresh_request`). If the record changed since it was read, it's refreshed by `_dynamo_touch` instead.
+        """
+        request = self._refresh_request(item, session_id, current_dt, return_values)
+        if request is None:
+            return None
+        try:
+            return self.boto_client().update_item(**request)
+        except ClientError as exc:
+            if not is_conditional_check_failure(exc):
+                raise
+        return self._dynamo_touch(session_id, current_dt, return_values)
+
+    def _dynamo_batch_get(self, session_ids: List[str]) -> List[Dict[str, Any]]:
+        """ Gets up to `BATCH_GET_MAX_KEYS` session records, retrying any unprocessed keys with exponential backoff, up
+        to `BATCH_GET_MAX_ATTEMPTS` requests in total.
+        """
+        client = self.boto_client()
+        items: List[Dict[str, Any]] = []
+        request_items = self._batch_get_request_items(session_ids)
+        backoff = BATCH_GET_BACKOFF_SECONDS
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                sleep(backoff)
+                backoff = min(backoff * 2, BATCH_GET_MAX_BACKOFF_SECONDS)
+            res = client.batch_get_item(RequestItems=request_items)
+            items.extend(res['Responses'].get(self.table_name, []))
+            request_items = res.get('UnprocessedKeys')
+            if not request_items:
+                return items
+        raise BatchLoadError(len(request_items[self.table_name]['Keys']))
+
+    def _dynamo_set(self, data: DynamoData, session_id, current_dt: datetime):
+        self.boto_client().update_item(**self._save_request(data, session_id, current_dt))
 
     def boto_client(self):
         if self._boto_client is None:
-            boto_client_kwargs = {}
-            if self.endpoint_url is not None:
-                boto_client_kwargs["endpoint_url"] = self.endpoint_url
-            if self.region_name is not None:
-                boto_client_kwargs["region_name"] = self.region_name
-            self._boto_client = boto3.client('dynamodb', **boto_client_kwargs)
+            if self.dax_endpoint_url is not None:
+                self._boto_client = shared_dax_client(self.dax_endpoint_url, self.region_name)
+            else:
+                self._boto_client = shared_boto_client(self.endpoint_url, self.region_name)
         return self._boto_client
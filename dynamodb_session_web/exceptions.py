@@ -18,3 +18,17 @@ class InvalidSessionIdError(SessionError):
     """Raised when using HMAC for session ID generation, and the ID is not valid."""
     def __str__(self) -> str:
         return f'InvalidSessionIdError: {self.loggable_sid}'
+
+
+class BatchLoadError(SessionError):
+    """Raised when DynamoDB still returns some of a batch load's session IDs as unprocessed after retrying them, e.g.
+    under sustained throttling.
+    """
+    unprocessed_count: int
+
+    def __init__(self, unprocessed_count: int):
+        self.unprocessed_count = unprocessed_count
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f'BatchLoadError: {self.unprocessed_count} session IDs were not processed'
@@ -1,6 +1,8 @@
-import json
-from dataclasses import asdict, dataclass
-from time import sleep
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import orjson
 
 from dynamodb_session_web import SessionManager, SessionDictInstance, SessionInstanceBase
 
@@ -8,58 +10,64 @@ LOCAL_ENDPOINT = 'http://localhost:8000'
 TABLE_NAME = 'app_session'
 
 
-def recreate_database():
+def prepare_database():
+    """ Creates the session table, or empties it if it already exists from an earlier run """
     import boto3
     import botocore
     dynamodb = boto3.resource('dynamodb', endpoint_url=LOCAL_ENDPOINT)
 
-    # Remove table (if it exists)
-    try:
-        table = dynamodb.Table(TABLE_NAME)
-        table.delete()
-    except botocore.exceptions.ClientError:
-        pass
-
     # Create the DynamoDB table.
-    return dynamodb.create_table(
-        TableName=TABLE_NAME,
-        KeySchema=[{
-            'AttributeName': 'id',
-            'KeyType': 'HASH'
-        }],
-        AttributeDefinitions=[{
-            'AttributeName': 'id',
-            'AttributeType': 'S'
-        }],
-        ProvisionedThroughput={
-            'ReadCapacityUnits': 5,
-            'WriteCapacityUnits': 5
-        }
-    )
+    try:
+        return dynamodb.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[{
+                'AttributeName': 'id',
+                'KeyType': 'HASH'
+            }],
+            AttributeDefinitions=[{
+                'AttributeName': 'id',
+                'AttributeType': 'S'
+            }],
+            ProvisionedThroughput={
+                'ReadCapacityUnits': 5,
+                'WriteCapacityUnits': 5
+            }
+        )
+    except botocore.exceptions.ClientError as exc:
+        if exc.response['Error']['Code'] != 'ResourceInUseException':
+            raise
+
+    # Deleting the items is much quicker than deleting and recreating the table
+    table = dynamodb.Table(TABLE_NAME)
+    with table.batch_writer() as batch:
+        for item in table.scan(ProjectionExpression='id', ConsistentRead=True)['Items']:
+            batch.delete_item(Key={'id': item['id']})
+    return table
 
 
 def print_table_data(table):
     from decimal import Decimal
 
-    class DecimalEncoder(json.JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, Decimal):
-                return str(obj)
-            return json.JSONEncoder.default(self, obj)
-
-    response = table.scan(
-        Select='ALL_ATTRIBUTES',
-        ConsistentRead=True
-    )
-    if len(response.get('Items', [])) > 0:
-        print(json.dumps(response['Items'], indent=2, cls=DecimalEncoder))
-    else:
+    def default(obj):
+        # Numbers are scanned as Decimal, and the session data as Binary, neither of which orjson serializes
+        return str(obj) if isinstance(obj, Decimal) else repr(obj.value)
+
+    # Each page of the scan is printed as it arrives, rather than collecting the whole table first
+    scan_kwargs = {'Select': 'ALL_ATTRIBUTES', 'ConsistentRead': True}
+    found_items = False
+    while True:
+        response = table.scan(**scan_kwargs)
+        if response['Items']:
+            found_items = True
+            print(orjson.dumps(response['Items'], default=default, option=orjson.OPT_INDENT_2).decode())
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    if not found_items:
         print('>>>> No Data in DynamoDB <<<<')
 
 
-dynamo_table = recreate_database()
-
-
 @dataclass
 class MySession(SessionInstanceBase):
     fruit: str = ''
@@ -69,15 +77,15 @@ class MySession(SessionInstanceBase):
         super().__init__(**kwargs)
 
     def deserialize(self, data):
-        data_dict = json.loads(data)
+        data_dict = orjson.loads(data)
         self.fruit = data_dict['fruit']
         self.color = data_dict['color']
 
     def serialize(self):
-        return json.dumps(asdict(self))
+        return orjson.dumps({'fruit': self.fruit, 'color': self.color})
 
 
-def dataclass_example():
+def dataclass_example(dynamo_table):
     """ Create a session manager using `MySession` as the data type """
     print('========== Data Class Example ==========')
     session = SessionManager(MySession, endpoint_url=LOCAL_ENDPOINT)
@@ -109,7 +117,7 @@ def dataclass_example():
     print()
 
 
-def default_example():
+def default_example(dynamo_table):
     """ Create a session manager using default dictionary data type """
     print('========== Default Example ==========')
     session = SessionManager(endpoint_url=LOCAL_ENDPOINT)
@@ -141,7 +149,7 @@ def default_example():
     print()
 
 
-def timeout_example():
+def timeout_example(dynamo_table):
     """ Example with extremely short timeout """
     print('========== Session Expiration Example ==========')
     session = SessionManager(SessionDictInstance, endpoint_url=LOCAL_ENDPOINT)
@@ -162,10 +170,11 @@ def timeout_example():
     print_table_data(dynamo_table)
     print()
 
-    print('Sleeping for 35 seconds')
-    sleep(35)
-
-    loaded_data = session.load(session_id)
+    # Rather than sleeping, move the session manager's clock forward past the timeout
+    print('Loading 35 seconds later')
+    later = datetime.now(tz=timezone.utc) + timedelta(seconds=35)
+    with patch('dynamodb_session_web._session.current_datetime', return_value=later):
+        loaded_data = session.load(session_id)
     print('Loaded data from Session record: ')
     print(loaded_data)
     print()
@@ -174,6 +183,12 @@ def timeout_example():
     print_table_data(dynamo_table)
 
 
-dataclass_example()
-default_example()
-timeout_example()
+def main():
+    dynamo_table = prepare_database()
+    dataclass_example(dynamo_table)
+    default_example(dynamo_table)
+    timeout_example(dynamo_table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+import pytest
+
+# Lets the assertion helpers in utility report the same detailed failures as asserts in the test modules
+pytest.register_assert_rewrite('tests.utility')
@@ -2,11 +2,26 @@ import botocore
 import pytest
 from pytest_mock import MockerFixture
 from dynamodb_session_web import SessionManager
-from .utility import get_dynamo_resource, TABLE_NAME
+from .utility import Clock, get_dynamo_resource, LOCAL_PORT, TABLE_NAME, USE_DYNAMODB_LOCAL
 
 
-@pytest.fixture(scope='function')
-def dynamodb_table(docker_services):  # pylint: disable=unused-argument
+@pytest.fixture(scope='session')
+def _dynamodb_server(request):
+    if USE_DYNAMODB_LOCAL:
+        request.getfixturevalue('docker_services')
+        yield
+        return
+
+    # moto is only needed when the tests don't use DynamoDB Local
+    from moto.server import ThreadedMotoServer  # pylint: disable=import-outside-toplevel
+    server = ThreadedMotoServer(port=LOCAL_PORT, verbose=False)
+    server.start()
+    yield
+    server.stop()
+
+
+@pytest.fixture(scope='session')
+def _dynamodb_session_table(_dynamodb_server):
     dynamodb = get_dynamo_resource()
 
     # Remove table (if it exists)
@@ -34,12 +49,36 @@ def dynamodb_table(docker_services):  # pylint: disable=unused-argument
         }
     )
 
-    # Wait until the table exists.
-    table.meta.client.get_waiter('table_exists').wait(TableName=TABLE_NAME)
-    yield
+    # Wait until the table exists. Local tables are ready almost immediately, so poll far more often than the default
+    table.meta.client.get_waiter('table_exists').wait(TableName=TABLE_NAME,
+                                                      WaiterConfig={'Delay': 0.1, 'MaxAttempts': 100})
+    yield table
     table.delete()
 
 
+@pytest.fixture(scope='function')
+def dynamodb_table(_dynamodb_session_table):
+    """ An empty session table. The table is created once per test run, and its items are deleted before each test. """
+    scan_kwargs = {'ProjectionExpression': 'id', 'ConsistentRead': True}
+    with _dynamodb_session_table.batch_writer() as batch:
+        while True:
+            response = _dynamodb_session_table.scan(**scan_kwargs)
+            for item in response['Items']:
+                batch.delete_item(Key={'id': item['id']})
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return _dynamodb_session_table
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    """ Controls the current time seen by session managers; see `Clock`. """
+    test_clock = Clock()
+    monkeypatch.setattr('dynamodb_session_web._session.current_datetime', test_clock)
+    return test_clock
+
+
 @pytest.fixture
 def mock_dynamo_set(mocker: MockerFixture):
     return mocker.patch.object(SessionManager, '_dynamo_set')
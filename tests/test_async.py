@@ -0,0 +1,231 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dynamodb_session_web import AsyncSessionManager, NullSessionInstance, SessionDictInstance
+from dynamodb_session_web._async import shared_aio_client
+from dynamodb_session_web.exceptions import InvalidSessionIdError, SessionNotFoundError
+from .test_integration import (assert_record_upgraded_at_ten_am, DEFAULT_ABSOLUTE_TIMEOUT, FUTURE_DATETIME, NINE_AM,
+                               put_record_saved_at_nine_am_by_earlier_version, TEN_AM)
+from .utility import create_session_manager, get_dynamo_record, LOCAL_ENDPOINT, LOCAL_REGION_NAME, str_param, TABLE_NAME
+
+pytest.importorskip('aiobotocore')
+
+
+def create_async_session_manager(**kwargs) -> AsyncSessionManager[SessionDictInstance]:
+    return AsyncSessionManager(SessionDictInstance, table_name=TABLE_NAME, endpoint_url=LOCAL_ENDPOINT,
+                               region_name=LOCAL_REGION_NAME, **kwargs)
+
+
+def run(coroutine_function, **kwargs):
+    """ Runs a test coroutine with a new async session manager, created with `kwargs`, closing the manager's client
+    afterwards.
+    """
+    async def wrapper():
+        async with create_async_session_manager(**kwargs) as session:
+            return await coroutine_function(session)
+    return asyncio.run(wrapper())
+
+
+# noinspection PyClassHasNoInit
+class TestAsyncIntegration:
+
+    @pytest.fixture(autouse=True)
+    def _dynamodb_local(self, dynamodb_table):  # pylint: disable=unused-argument
+        return
+
+    def test_dictionary_save_load(self):
+        expected_key = str_param()
+        expected_value = str_param()
+
+        async def test(session):
+            session_instance = session.create()
+            session_instance[expected_key] = expected_value
+            await session.save(session_instance)
+            return await session.load(session_instance.session_id)
+
+        actual_data = run(test)
+        assert actual_data[expected_key] == expected_value
+
+    def test_create_and_save(self):
+        async def test(session):
+            return await session.create_and_save()
+
+        session_instance = run(test)
+        assert get_dynamo_record(session_instance.session_id) is not None
+
+    def test_load_sync_saved_session(self):
+        expected_value = str_param()
+        sync_session = create_session_manager()
+        session_instance = sync_session.create()
+        session_instance['foo'] = expected_value
+        sync_session.save(session_instance)
+
+        async def test(session):
+            return await session.load(session_instance.session_id)
+
+        assert run(test)['foo'] == expected_value
+
+    def test_load_unknown_session(self):
+        async def test(session):
+            return await session.load(str_param())
+
+        assert isinstance(run(test), NullSessionInstance)
+
+    def test_load_invalid_hmac_sid_raises(self):
+        async def test(_):
+            async with create_async_session_manager(sid_keys=['foo'], bad_session_id_raises=True) as session:
+                await session.load('some_unknown_session_id')
+
+        with pytest.raises(InvalidSessionIdError):
+            run(test)
+
+    def test_expired_session_returns_null_session(self, clock):
+        async def test(session):
+            session_instance = await session.create_and_save()
+            clock.set(FUTURE_DATETIME)
+            return session_instance, await session.load(session_instance.session_id)
+
+        session_instance, actual = run(test)
+        assert isinstance(actual, NullSessionInstance)
+        assert actual.session_id == session_instance.session_id
+
+    def test_expired_session_raises(self, clock):
+        async def test(session):
+            session_instance = await session.create_and_save()
+            clock.set(FUTURE_DATETIME)
+            await session.load(session_instance.session_id)
+
+        with pytest.raises(SessionNotFoundError):
+            run(test, bad_session_id_raises=True)
+
+    def test_load_is_single_request(self, mocker):
+        async def test(session):
+            session_instance = await session.create_and_save()
+            client = await session.boto_client()
+            spy_update = mocker.spy(client, 'update_item')
+            spy_get = mocker.spy(client, 'get_item')
+            await session.load(session_instance.session_id)
+            return spy_update.call_count, spy_get.call_count
+
+        assert run(test, touch_interval_seconds=0) == (1, 0)
+
+    def test_load_past_idle_cutoff_refreshes_with_one_update(self, mocker, clock):
+        async def test(session):
+            clock.set(datetime.fromtimestamp(NINE_AM, tz=timezone.utc))
+            session_instance = await session.create_and_save()
+            clock.set(datetime(2021, 3, 1, 18, tzinfo=timezone.utc))
+            await session.save(session_instance)
+            client = await session.boto_client()
+            spy_update = mocker.spy(client, 'update_item')
+            spy_get = mocker.spy(client, 'get_item')
+            clock.set(datetime(2021, 3, 1, 19, 30, tzinfo=timezone.utc))
+            await session.load(session_instance.session_id)
+            return session_instance, spy_get.call_count, spy_update.call_count
+
+        session_instance, get_count, update_count = run(test)
+        assert (get_count, update_count) == (1, 1)
+        assert get_dynamo_record(session_instance.session_id)['expires'] == NINE_AM + DEFAULT_ABSOLUTE_TIMEOUT
+
+    @pytest.mark.parametrize('touch_interval', [0, 60])
+    def test_load_upgrades_record_saved_by_earlier_version(self, clock, touch_interval):
+        session_id = str_param()
+        put_record_saved_at_nine_am_by_earlier_version(session_id)
+        clock.set(datetime.fromtimestamp(TEN_AM, tz=timezone.utc))
+
+        async def test(session):
+            return await session.load(session_id)
+
+        assert run(test, touch_interval_seconds=touch_interval)['foo'] == 'bar'
+        assert_record_upgraded_at_ten_am(session_id)
+
+    def test_touch_interval_skips_refresh(self, mocker, clock):
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        clock.set(initial_datetime)
+
+        async def test(session):
+            session_instance = await session.create_and_save()
+            spy_update = mocker.spy(await session.boto_client(), 'update_item')
+            clock.set(initial_datetime + timedelta(seconds=59))
+            await session.load(session_instance.session_id)
+            return session_instance, spy_update.call_count
+
+        session_instance, update_count = run(test, touch_interval_seconds=60)
+        assert update_count == 0
+        assert get_dynamo_record(session_instance.session_id)['accessed'] == initial_datetime.isoformat()
+
+    @pytest.mark.parametrize('settings, elapsed_seconds', [
+        ({'touch_interval_seconds': 60}, 60),
+        ({'idle_timeout_seconds': 300}, 30),
+    ])
+    def test_touch_interval_refreshes(self, clock, settings, elapsed_seconds):
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        accessed_datetime = initial_datetime + timedelta(seconds=elapsed_seconds)
+        clock.set(initial_datetime)
+
+        async def test(session):
+            session_instance = await session.create_and_save()
+            clock.set(accessed_datetime)
+            await session.load(session_instance.session_id)
+            return session_instance
+
+        session_instance = run(test, **settings)
+        assert get_dynamo_record(session_instance.session_id)['accessed'] == accessed_datetime.isoformat()
+
+    def test_touch_interval_expired_session(self, clock):
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        clock.set(initial_datetime)
+
+        async def test(session):
+            session_instance = await session.create_and_save()
+            clock.set(initial_datetime + timedelta(seconds=30))
+            return await session.load(session_instance.session_id)
+
+        assert isinstance(run(test, touch_interval_seconds=60, idle_timeout_seconds=30), NullSessionInstance)
+
+    def test_clear(self):
+        async def test(session):
+            session_instance = await session.create_and_save()
+            await session.clear(session_instance.session_id)
+            return session_instance
+
+        assert get_dynamo_record(run(test).session_id) is None
+
+    def test_batch_load(self):
+        async def test(session):
+            session_instances = [await session.create_and_save() for _ in range(3)]
+            return session_instances, await session.batch_load([s.session_id for s in session_instances] + ['unknown'])
+
+        session_instances, actual = run(test)
+        assert set(actual) == {s.session_id for s in session_instances}
+
+    def test_boto_client_is_shared_per_loop(self):
+        async def test(session):
+            other_session = create_async_session_manager()
+            return await session.boto_client() is await other_session.boto_client()
+
+        assert run(test)
+
+    def test_boto_client_is_created_once_for_concurrent_callers(self, mocker):
+        clients = []
+
+        class ClientContext:  # pylint: disable=too-few-public-methods
+            async def __aenter__(self):
+                await asyncio.sleep(0)  # Suspends, like resolving credentials from the instance metadata service
+                clients.append(object())
+                return clients[-1]
+
+        mocker.patch('dynamodb_session_web._async._aio_session').return_value.create_client.return_value = \
+            ClientContext()
+
+        async def test():
+            await asyncio.gather(*(shared_aio_client('http://concurrent', None) for _ in range(4)))
+
+        asyncio.run(test())
+        assert len(clients) == 1
+
+    @pytest.mark.parametrize('setting', [{'dax_endpoint_url': 'dax://localhost'}, {'touch_in_background': True}])
+    def test_unsupported_settings_raise(self, setting):
+        with pytest.raises(ValueError):
+            create_async_session_manager(**setting)
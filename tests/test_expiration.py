@@ -1,14 +1,13 @@
-from datetime import datetime, timezone
 
 import pytest
 from pytest import param
 
 # noinspection PyProtectedMember
-from dynamodb_session_web._session import expiration_datetime
+from dynamodb_session_web._session import expiration_datetime, expiration_timestamp
 
 
-EIGHT_AM = int(datetime(2021, 3, 1, 8, 0, 0, tzinfo=timezone.utc).timestamp())
-FIVE_PM = int(datetime(2021, 3, 1, 17, 0, 0, tzinfo=timezone.utc).timestamp())
+EIGHT_AM = 1614585600  # 2021-03-01T08:00:00+00:00
+FIVE_PM = 1614618000  # 2021-03-01T17:00:00+00:00
 
 TWO_HOURS = 7200
 TWELVE_HOURS = 43200
@@ -16,45 +15,43 @@ TWELVE_HOURS = 43200
 
 @pytest.mark.parametrize(
     'idle_timeout, absolute_timeout, created, accessed, expected', [
-        param(TWO_HOURS, TWELVE_HOURS, 'Mar 1 2021, 5 AM', 'Mar 1 2021, 6 AM', EIGHT_AM,
+        param(TWO_HOURS, TWELVE_HOURS, '2021-03-01T05:00:00+00:00', '2021-03-01T06:00:00+00:00', EIGHT_AM,
               id='Idle expires before absolute'),
-        param(TWO_HOURS, TWELVE_HOURS, 'Mar 1 2021, 5 AM', 'Mar 1 2021, 4 PM', FIVE_PM,
+        param(TWO_HOURS, TWELVE_HOURS, '2021-03-01T05:00:00+00:00', '2021-03-01T16:00:00+00:00', FIVE_PM,
               id='Absolute causes expiration'),
     ]
 )
 def test_expiration(idle_timeout, absolute_timeout, created, accessed, expected):
-    dt_format = '%b %d %Y, %I %p'
-    created_dt = datetime.strptime(created, dt_format).replace(tzinfo=timezone.utc)
-    accessed_dt = datetime.strptime(accessed, dt_format).replace(tzinfo=timezone.utc)
+    assert expiration_datetime(idle_timeout, absolute_timeout, created, accessed) == expected
 
-    actual = expiration_datetime(idle_timeout, absolute_timeout, created_dt.isoformat(), accessed_dt.isoformat())
 
-    assert actual == expected
+@pytest.mark.parametrize(
+    'idle_timeout, absolute_timeout, created, accessed, expected', [
+        param(TWO_HOURS, TWELVE_HOURS, EIGHT_AM - 3 * 3600, EIGHT_AM - 2 * 3600, EIGHT_AM,
+              id='Idle expires before absolute'),
+        param(TWO_HOURS, TWELVE_HOURS, FIVE_PM - 12 * 3600, FIVE_PM - 3600, FIVE_PM,
+              id='Absolute causes expiration'),
+    ]
+)
+def test_expiration_timestamp(idle_timeout, absolute_timeout, created, accessed, expected):
+    assert expiration_timestamp(idle_timeout, absolute_timeout, created, accessed) == expected
 
 
 @pytest.mark.parametrize(
     'idle_timeout, absolute_timeout, created, accessed', [
-        param(TWO_HOURS, TWELVE_HOURS, 'Mar 1 2021, 5 AM', 'Mar 1 2021, 4 PM'),
+        param(TWO_HOURS, TWELVE_HOURS, '2021-03-01T05:00:00', '2021-03-01T16:00:00+00:00'),
     ]
 )
 def test_expiration_created_must_be_utc(idle_timeout, absolute_timeout, created, accessed):
-    dt_format = '%b %d %Y, %I %p'
-    created_dt = datetime.strptime(created, dt_format)
-    accessed_dt = datetime.strptime(accessed, dt_format).replace(tzinfo=timezone.utc)
-
     with pytest.raises(ValueError, match='created'):
-        expiration_datetime(idle_timeout, absolute_timeout, created_dt.isoformat(), accessed_dt.isoformat())
+        expiration_datetime(idle_timeout, absolute_timeout, created, accessed)
 
 
 @pytest.mark.parametrize(
     'idle_timeout, absolute_timeout, created, accessed', [
-        param(TWO_HOURS, TWELVE_HOURS, 'Mar 1 2021, 5 AM', 'Mar 1 2021, 4 PM'),
+        param(TWO_HOURS, TWELVE_HOURS, '2021-03-01T05:00:00+00:00', '2021-03-01T16:00:00'),
     ]
 )
 def test_expiration_accessed_must_be_utc(idle_timeout, absolute_timeout, created, accessed):
-    dt_format = '%b %d %Y, %I %p'
-    created_dt = datetime.strptime(created, dt_format).replace(tzinfo=timezone.utc)
-    accessed_dt = datetime.strptime(accessed, dt_format)
-
     with pytest.raises(ValueError, match='accessed'):
-        expiration_datetime(idle_timeout, absolute_timeout, created_dt.isoformat(), accessed_dt.isoformat())
+        expiration_datetime(idle_timeout, absolute_timeout, created, accessed)
@@ -1,5 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from secrets import token_urlsafe
+
 import pytest
-from dynamodb_session_web import SessionManager, SessionDictInstance
+from botocore.validate import ParamValidationDecorator
+from itsdangerous import Signer
+from dynamodb_session_web import NullSessionInstance, SessionManager, SessionDictInstance, TypedSessionInstance
+from dynamodb_session_web._session import SessionIdSigner, create_session_id
 
 
 # noinspection PyClassHasNoInit
@@ -34,6 +40,76 @@ class TestSessionInstance:
         with pytest.raises(ValueError):
             SessionDictInstance(absolute_timeout_seconds='a')
 
+    def test_loggable_session_id_follows_session_id(self):
+        instance = SessionDictInstance(session_id='first')
+        first_loggable_sid = instance.loggable_session_id
+
+        instance.session_id = 'second'
+
+        assert instance.loggable_session_id != first_loggable_sid
+        assert instance.loggable_session_id == SessionDictInstance(session_id='second').loggable_session_id
+
+    def test_serialize_round_trip(self):
+        expected = {'foo': 'bar', 'one': 1, 'nested': {'list': [1, 2.5, None, True]}, 'unicode': 'caf\u00e9'}
+        instance = SessionDictInstance()
+        instance.update(expected)
+
+        actual = SessionDictInstance()
+        actual.deserialize(instance.serialize())
+
+        assert actual == expected
+
+    def test_instance_attributes_use_slots(self):
+        actual = SessionDictInstance(session_id='foo')
+
+        assert not actual.__dict__
+        assert not hasattr(NullSessionInstance(), '__dict__')
+
+
+class FruitSession(TypedSessionInstance):
+    fruit: str = ''
+    count: int = 0
+
+
+class ColoredFruitSession(FruitSession):
+    color: str = ''
+
+
+class BasketSession(TypedSessionInstance):
+    items: list = []
+
+
+# noinspection PyClassHasNoInit
+class TestTypedSessionInstance:
+    def test_fields(self):
+        # pylint: disable=protected-access
+        assert FruitSession._fields == ('fruit', 'count')
+        assert ColoredFruitSession._fields == ('fruit', 'count', 'color')
+
+    def test_serialize_round_trip(self):
+        instance = ColoredFruitSession()
+        instance.fruit = 'apple'
+        instance.color = 'red'
+
+        actual = ColoredFruitSession()
+        actual.deserialize(instance.serialize())
+
+        assert (actual.fruit, actual.count, actual.color) == ('apple', 0, 'red')
+
+    def test_deserialize_missing_field_keeps_default(self):
+        actual = ColoredFruitSession()
+        actual.deserialize(b'{"fruit": "apple", "unknown": 1}')
+
+        assert (actual.fruit, actual.count, actual.color) == ('apple', 0, '')
+        assert not hasattr(actual, 'unknown')
+
+    def test_mutable_default_is_not_shared(self):
+        first = BasketSession()
+        first.items.append('secret')
+
+        assert not BasketSession().items
+        assert not BasketSession.items
+
 
 class TestSessionCore:
     def test_default_settings(self):
@@ -82,3 +158,66 @@ class TestSessionCore:
         assert actual._idle_timeout == expected_idle_timeout  # pylint: disable=protected-access
         assert actual._absolute_timeout == expected_absolute_timeout  # pylint: disable=protected-access
         assert isinstance(actual.create(), SessionDictInstance)
+
+    def test_unsupported_compression_raises(self):
+        with pytest.raises(ValueError):
+            SessionManager(compression='lzma')
+
+    def test_boto_client_is_shared(self):
+        first = SessionManager(endpoint_url='http://localhost:8000', region_name='us-east-1')
+        second = SessionManager(endpoint_url='http://localhost:8000', region_name='us-east-1')
+        other_region = SessionManager(endpoint_url='http://localhost:8000', region_name='us-west-2')
+
+        assert first.boto_client() is second.boto_client()
+        assert first.boto_client() is not other_region.boto_client()
+
+    def test_boto_client_is_shared_across_threads(self):
+        managers = [SessionManager(endpoint_url='http://localhost:8000', region_name='eu-west-3') for _ in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda manager: manager.boto_client(), managers))
+
+        assert all(client is clients[0] for client in clients)
+
+    def test_boto_client_skips_parameter_validation(self):
+        client = SessionManager(endpoint_url='http://localhost:8000', region_name='us-east-1').boto_client()
+
+        # pylint: disable=protected-access
+        assert not isinstance(client._serializer, ParamValidationDecorator)
+
+    def test_dax_client(self, mocker):
+        amazondax = mocker.patch.dict('sys.modules', {'amazondax': mocker.Mock()})['amazondax']
+        session = SessionManager(region_name='us-east-1', dax_endpoint_url='dax://my-cluster')
+
+        actual = session.boto_client()
+
+        assert actual is amazondax.AmazonDaxClient.return_value
+        assert actual is SessionManager(region_name='us-east-1', dax_endpoint_url='dax://my-cluster').boto_client()
+        assert amazondax.AmazonDaxClient.call_args[1]['endpoint_url'] == 'dax://my-cluster'
+        # pylint: disable=protected-access
+        assert session._read_request('foo')['ConsistentRead'] is False
+        assert SessionManager()._read_request('foo')['ConsistentRead'] is True
+
+    def test_boto_client_config(self):
+        config = SessionManager(endpoint_url='http://localhost:8000', region_name='us-east-1').boto_client().meta.config
+
+        assert config.tcp_keepalive is True
+        assert config.max_pool_connections == 50
+        assert config.retries['mode'] == 'adaptive'
+
+
+@pytest.mark.parametrize('byte_length', [1, 2, 3, 4, 31, 32, 33, 128])
+def test_create_session_id_matches_token_urlsafe_length(byte_length):
+    actual = create_session_id(byte_length)
+
+    assert len(actual) == len(token_urlsafe(byte_length))
+    assert '=' not in actual
+
+
+def test_session_id_signer_matches_default_signer():
+    keys = ['old key', 'new key']
+    signer = SessionIdSigner(keys)
+    default_signer = Signer(keys)
+    old_session_id = Signer(keys[0]).sign('some session id')
+
+    assert signer.sign('some session id') == default_signer.sign('some session id')
+    assert signer.unsign(old_session_id) == default_signer.unsign(old_session_id)
@@ -1,32 +1,59 @@
-import hashlib
 import json
-from dataclasses import asdict, dataclass
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import List
 
 import pytest
 from pytest import param
 
 from dynamodb_session_web import NullSessionInstance, SessionManager, SessionInstanceBase
-from dynamodb_session_web.exceptions import InvalidSessionIdError, SessionNotFoundError
+from dynamodb_session_web._session import BATCH_GET_MAX_ATTEMPTS
+from dynamodb_session_web.exceptions import BatchLoadError, InvalidSessionIdError, SessionNotFoundError
 from .utility import (
+    assert_record_matches,
     create_session_manager,
+    expected_loggable_session_id,
     get_dynamo_record,
+    get_dynamo_table,
     LOCAL_ENDPOINT,
     LOCAL_REGION_NAME,
-    mock_current_datetime,
-    str_param
+    str_param,
+    TABLE_NAME
 )
 
 DEFAULT_IDLE_TIMEOUT = 7200  # two hours
 DEFAULT_ABSOLUTE_TIMEOUT = 43200  # twelve hours
 
-FUTURE_DATETIME = datetime.utcnow() + timedelta(days=300)
+FUTURE_DATETIME = datetime(2999, 1, 1, tzinfo=timezone.utc)  # Well after any session created by the tests expires
 FOUR_HOURS_IN_SECONDS = 14400
 SIX_HOURS_IN_SECONDS = 21600
-NINE_AM = int(datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc).timestamp())
-TEN_AM = int(datetime(2021, 3, 1, 10, 0, 0, tzinfo=timezone.utc).timestamp())
-ELEVEN_AM = int(datetime(2021, 3, 1, 11, 0, 0, tzinfo=timezone.utc).timestamp())
-FRIENDLY_DT_FORMAT = '%b %d %Y, %I %p'
+NINE_AM = 1614589200  # 2021-03-01T09:00:00+00:00
+TEN_AM = 1614592800  # 2021-03-01T10:00:00+00:00
+ELEVEN_AM = 1614596400  # 2021-03-01T11:00:00+00:00
+
+
+def put_record_saved_at_nine_am_by_earlier_version(session_id: str) -> None:
+    """ Stores a session in the format of version 0.2.9, last accessed at 9:30. """
+    get_dynamo_table().put_item(Item={
+        'id': session_id,
+        'created': '2021-03-01T09:00:00+00:00',
+        'accessed': '2021-03-01T09:30:00+00:00',
+        'expires': NINE_AM + 1800 + DEFAULT_IDLE_TIMEOUT,
+        'idle_timeout': DEFAULT_IDLE_TIMEOUT,
+        'absolute_timeout': DEFAULT_ABSOLUTE_TIMEOUT,
+        'data': '{"foo": "bar"}',
+    })
+
+
+def assert_record_upgraded_at_ten_am(session_id: str) -> None:
+    assert_record_matches(session_id, {
+        'created': NINE_AM,
+        'accessed': '2021-03-01T10:00:00+00:00',
+        'expires': TEN_AM + DEFAULT_IDLE_TIMEOUT,
+        'idle_cutoff': NINE_AM + DEFAULT_ABSOLUTE_TIMEOUT - DEFAULT_IDLE_TIMEOUT,
+    })
 
 
 # pylint: disable=too-many-arguments
@@ -56,6 +83,24 @@ class TestIntegration:
         actual_data = session.load(session_instance.session_id)
         assert actual_data[expected_key] == expected_value
 
+    @pytest.mark.parametrize('compression, expected_prefix', [('zlib', b'\x01'), ('zstd', b'\x02')])
+    def test_large_session_is_compressed(self, compression, expected_prefix):
+        if compression == 'zstd':
+            pytest.importorskip('zstandard')
+        expected_value = 'x' * 10000
+
+        session = create_session_manager(compression=compression)
+        session_instance = session.create()
+        session_instance['large'] = expected_value
+        session.save(session_instance)
+
+        actual_record = get_dynamo_record(session_instance.session_id)
+        actual_data = session.load(session_instance.session_id)
+
+        assert actual_record['data'].value[:1] == expected_prefix
+        assert len(actual_record['data'].value) < len(expected_value)
+        assert actual_data['large'] == expected_value
+
     def test_hmac_sid(self):
         expected_key = str_param()
         expected_value = str_param()
@@ -76,8 +121,7 @@ class TestIntegration:
 
     def test_hmac_sid_invalid_raises(self):
         bad_sid = 'my string.wh6tMHxLgJqB6oY1uT73iMlyrOA'
-        expected_loggable_sid = '89e1eef25672719323a4e0918c1474d74af3041cd2bb719c377038e467ef9fa1' \
-                                '756c5bbb3ad024c9b2c0b1b1aff0a9948e77f4c00d1114310c3b48a14080d736'
+        expected_loggable_sid = 'ab4b5d28b5d8c79cd499eafeb9a474a3'
 
         session = create_session_manager(sid_keys=['foo'], bad_session_id_raises=True)
 
@@ -100,9 +144,10 @@ class TestIntegration:
                 self.color = data_dict['color']
 
             def serialize(self):
-                return json.dumps(asdict(self))
+                return json.dumps({'fruit': self.fruit, 'color': self.color})
 
-        session = SessionManager(MySession, endpoint_url=LOCAL_ENDPOINT, region_name=LOCAL_REGION_NAME)
+        session = SessionManager(MySession, table_name=TABLE_NAME, endpoint_url=LOCAL_ENDPOINT,
+                                 region_name=LOCAL_REGION_NAME)
         initial_data = session.create()
         initial_data.fruit = 'apple'
         initial_data.color = 'red'
@@ -151,8 +196,7 @@ class TestIntegration:
     def test_random_session_id_load_returns_null_session(self):
         session = create_session_manager()
         sid = 'some_unknown_session_id'
-        expected_loggable_sid = '4ee055b82b9f592c6a5a0bc8d2a0b59890b97c93cc68db0f6738df05c37089ab' \
-                                'a958d405b82ec604209074a7a8d5b9fc55211b6ef1ed9e7832a58b05abadb04b'
+        expected_loggable_sid = '70b3ffd8bd4cc3afbb8896690c2bb0dd'
 
         actual = session.load(sid)
 
@@ -163,18 +207,17 @@ class TestIntegration:
     def test_random_session_id_load_raises(self):
         session = create_session_manager(bad_session_id_raises=True)
         sid = 'some_unknown_session_id'
-        expected_loggable_sid = '4ee055b82b9f592c6a5a0bc8d2a0b59890b97c93cc68db0f6738df05c37089ab' \
-                                'a958d405b82ec604209074a7a8d5b9fc55211b6ef1ed9e7832a58b05abadb04b'
+        expected_loggable_sid = '70b3ffd8bd4cc3afbb8896690c2bb0dd'
 
         with pytest.raises(SessionNotFoundError, match=expected_loggable_sid):
             session.load(sid)
 
-    def test_expired_session_returns_null_session(self, mocker):
+    def test_expired_session_returns_null_session(self, clock):
         session = create_session_manager()
         session_instance = session.create_and_save()
         expected_session_id = session_instance.session_id
-        expected_loggable_sid = hashlib.sha512(expected_session_id.encode()).hexdigest()
-        mock_current_datetime(mocker, FUTURE_DATETIME)
+        expected_loggable_sid = expected_loggable_session_id(expected_session_id)
+        clock.set(FUTURE_DATETIME)
 
         actual = session.load(session_instance.session_id)
 
@@ -182,84 +225,203 @@ class TestIntegration:
         assert actual.session_id == expected_session_id
         assert actual.loggable_session_id == expected_loggable_sid
 
-    def test_expired_session_raises(self, mocker):
+    def test_expired_session_raises(self, clock):
         session = create_session_manager(bad_session_id_raises=True)
         session_instance = session.create_and_save()
         expected_session_id = session_instance.session_id
-        expected_loggable_sid = hashlib.sha512(expected_session_id.encode()).hexdigest()
-        mock_current_datetime(mocker, FUTURE_DATETIME)
+        expected_loggable_sid = expected_loggable_session_id(expected_session_id)
+        clock.set(FUTURE_DATETIME)
 
         with pytest.raises(SessionNotFoundError, match=expected_loggable_sid):
             session.load(session_instance.session_id)
 
-    def test_save_sets_all_expected_attributes(self, mocker):
+    def test_save_sets_all_expected_attributes(self, clock):
         session = create_session_manager()
         initial_datetime = datetime(1977, 12, 28, 12, 40, 0, 0, tzinfo=timezone.utc)
-        mock_current_datetime(mocker, initial_datetime)
+        clock.set(initial_datetime)
 
         session_instance = session.create_and_save()
-        actual_record = get_dynamo_record(session_instance.session_id)
+        initial_timestamp = int(initial_datetime.timestamp())
+
+        assert_record_matches(session_instance.session_id, {
+            'expires': initial_timestamp + DEFAULT_IDLE_TIMEOUT,
+            'accessed': initial_datetime.isoformat(),
+            'created': initial_timestamp,
+            'idle_timeout': DEFAULT_IDLE_TIMEOUT,
+            'absolute_timeout': DEFAULT_ABSOLUTE_TIMEOUT,
+            'idle_cutoff': initial_timestamp + DEFAULT_ABSOLUTE_TIMEOUT - DEFAULT_IDLE_TIMEOUT,
+        })
+
+    def test_load_is_single_request(self, mocker):
+        session = create_session_manager(touch_interval_seconds=0)
+        session_instance = session.create_and_save()
+        spy_update = mocker.spy(session.boto_client(), 'update_item')
+        spy_get = mocker.spy(session.boto_client(), 'get_item')
 
-        assert actual_record['expires'] == int(initial_datetime.timestamp()) + DEFAULT_IDLE_TIMEOUT
-        assert actual_record['accessed'] == initial_datetime.isoformat()
-        assert actual_record['created'] == initial_datetime.isoformat()
-        assert actual_record['idle_timeout'] == DEFAULT_IDLE_TIMEOUT
-        assert actual_record['absolute_timeout'] == DEFAULT_ABSOLUTE_TIMEOUT
+        session.load(session_instance.session_id)
 
-    @pytest.mark.parametrize(
-        'created, accessed, expected_expires_post_created, expected_expires_post_accessed', [
-            param('Mar 1 2021, 5 AM', 'Mar 1 2021, 6 AM', NINE_AM, TEN_AM, id='Idle expires before absolute'),
-            param('Mar 1 2021, 5 AM', 'Mar 1 2021, 8 AM', NINE_AM, ELEVEN_AM, id='Absolute causes expiration'),
-        ]
-    )
-    def test_created_accessed_expires_value_for_create_load(
-            self, mocker, created, accessed, expected_expires_post_created,
-            expected_expires_post_accessed):
-        """
-        Tests that accessing a session an hour after creation updates the `accessed` field, but `created` is not
-        affected. `expires` *may* be updated, depending on how close the update is to the timeouts.
+        assert spy_update.call_count == 1
+        assert spy_get.call_count == 0
 
-        IMPORTANT - Timeouts used are:
-            IDLE     - 4 hours
-            ABSOLUTE - 6 hours
+    @pytest.mark.parametrize('expired', [False, True])
+    def test_load_missing_session_is_two_requests(self, mocker, clock, expired):
+        session = create_session_manager(touch_interval_seconds=0)
+        session_id = session.create_and_save().session_id if expired else str_param()
+        spy_update = mocker.spy(session.boto_client(), 'update_item')
+        spy_get = mocker.spy(session.boto_client(), 'get_item')
+        clock.set(FUTURE_DATETIME)
 
-        The inputs are roughly the same as in the `test_expiration.test_expiration` test, here we're just making sure
-        the values are persisted and used.
-        """
-        initial_dt = datetime.strptime(created, FRIENDLY_DT_FORMAT).replace(tzinfo=timezone.utc)
-        accessed_dt = datetime.strptime(accessed, FRIENDLY_DT_FORMAT).replace(tzinfo=timezone.utc)
-        expected_created = initial_dt.isoformat()
+        actual = session.load(session_id)
 
+        assert isinstance(actual, NullSessionInstance)
+        assert (spy_update.call_count, spy_get.call_count) == (1, 1)
+
+    def test_load_past_idle_cutoff_refreshes_with_one_update(self, mocker, clock):
         session = create_session_manager()
-        mock_current_datetime(mocker, initial_dt)
+        clock.set(datetime.fromtimestamp(NINE_AM, tz=timezone.utc))
+        session_instance = session.create_and_save()
+        clock.set(datetime(2021, 3, 1, 18, tzinfo=timezone.utc))
+        session.save(session_instance)
+        spy_update = mocker.spy(session.boto_client(), 'update_item')
+        spy_get = mocker.spy(session.boto_client(), 'get_item')
 
-        # Create Test
-        session_instance = session.create_and_save(idle_timeout_seconds=FOUR_HOURS_IN_SECONDS,
-                                                   absolute_timeout_seconds=SIX_HOURS_IN_SECONDS)
-        self.assert_actual_record_values(session_instance.session_id,
-                                         exp_created=expected_created,
-                                         exp_expired=expected_expires_post_created,
-                                         exp_accessed=initial_dt.isoformat())
+        clock.set(datetime(2021, 3, 1, 19, 30, tzinfo=timezone.utc))
+        session.load(session_instance.session_id)
+
+        assert (spy_get.call_count, spy_update.call_count) == (1, 1)
+        assert_record_matches(session_instance.session_id, {
+            'accessed': '2021-03-01T19:30:00+00:00',
+            'expires': NINE_AM + DEFAULT_ABSOLUTE_TIMEOUT,
+        })
+
+    @pytest.mark.parametrize('touch_interval', [0, 60])
+    def test_load_upgrades_record_saved_by_earlier_version(self, clock, touch_interval):
+        session_id = str_param()
+        put_record_saved_at_nine_am_by_earlier_version(session_id)
+        session = create_session_manager(touch_interval_seconds=touch_interval)
+        clock.set(datetime.fromtimestamp(TEN_AM, tz=timezone.utc))
+
+        actual = session.load(session_id)
+
+        assert actual['foo'] == 'bar'
+        assert_record_upgraded_at_ten_am(session_id)
+
+    def test_touch_interval_skips_refresh(self, mocker, clock):
+        session = create_session_manager(touch_interval_seconds=60)
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        clock.set(initial_datetime)
+        session_instance = session.create_and_save()
+        session_instance['foo'] = 'bar'
+        session.save(session_instance)
+        spy_update = mocker.spy(session.boto_client(), 'update_item')
+
+        clock.set(initial_datetime + timedelta(seconds=59))
+        actual = session.load(session_instance.session_id)
+
+        assert actual['foo'] == 'bar'
+        assert spy_update.call_count == 0
+        assert get_dynamo_record(session_instance.session_id)['accessed'] == initial_datetime.isoformat()
+
+    def test_touch_interval_uses_stored_access_time(self, mocker, clock):
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        clock.set(initial_datetime)
+        session_instance = create_session_manager().create_and_save()
+        other_session = create_session_manager()
+        spy_update = mocker.spy(other_session.boto_client(), 'update_item')
+
+        clock.set(initial_datetime + timedelta(seconds=59))
+        other_session.load(session_instance.session_id)
+
+        assert spy_update.call_count == 0
 
-        # Load Test for new datetime
-        mock_current_datetime(mocker, accessed_dt)
+    def test_touch_interval_limited_by_idle_timeout(self, clock):
+        session = create_session_manager(idle_timeout_seconds=300)
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        accessed_datetime = initial_datetime + timedelta(seconds=30)
+        clock.set(initial_datetime)
+        session_instance = session.create_and_save()
+
+        clock.set(accessed_datetime)
         session.load(session_instance.session_id)
-        self.assert_actual_record_values(session_instance.session_id,
-                                         exp_created=expected_created,
-                                         exp_expired=expected_expires_post_accessed,
-                                         exp_accessed=accessed_dt.isoformat())
 
+        assert get_dynamo_record(session_instance.session_id)['accessed'] == accessed_datetime.isoformat()
+
+    def test_touch_interval_refreshes_after_interval(self, clock):
+        session = create_session_manager(touch_interval_seconds=60)
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        accessed_datetime = initial_datetime + timedelta(seconds=60)
+        clock.set(initial_datetime)
+        session_instance = session.create_and_save()
+
+        clock.set(accessed_datetime)
+        session.load(session_instance.session_id)
+
+        assert get_dynamo_record(session_instance.session_id)['accessed'] == accessed_datetime.isoformat()
+
+    def test_touch_in_background(self, mocker, clock):
+        executor = ThreadPoolExecutor(max_workers=1)
+        mocker.patch('dynamodb_session_web._session._touch_executor', return_value=executor)
+        session = create_session_manager(touch_in_background=True)
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        accessed_datetime = initial_datetime + timedelta(seconds=60)
+        clock.set(initial_datetime)
+        session_instance = session.create_and_save()
+        session_instance['foo'] = 'bar'
+        session.save(session_instance)
+
+        clock.set(accessed_datetime)
+        actual = session.load(session_instance.session_id)
+        executor.shutdown(wait=True)
+
+        assert actual['foo'] == 'bar'
+        assert get_dynamo_record(session_instance.session_id)['accessed'] == accessed_datetime.isoformat()
+
+    def test_touch_in_background_is_queued_once_per_session(self, mocker):
+        pending_touches: List['Future[None]'] = []
+
+        def submit(*_):
+            pending_touches.append(Future())
+            return pending_touches[-1]
+
+        mocker.patch('dynamodb_session_web._session._touch_executor').return_value.submit.side_effect = submit
+        session = create_session_manager(touch_in_background=True, touch_interval_seconds=0)
+        session_instance = session.create_and_save()
+
+        session.load(session_instance.session_id)
+        session.load(session_instance.session_id)
+        pending_touches[0].set_result(None)
+        session.load(session_instance.session_id)
+        pending_touches[1].set_result(None)
+
+        assert len(pending_touches) == 2
+
+    def test_touch_interval_expired_session(self, clock):
+        session = create_session_manager(touch_interval_seconds=60, idle_timeout_seconds=30)
+        initial_datetime = datetime(2021, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+        clock.set(initial_datetime)
+        session_instance = session.create_and_save()
+
+        clock.set(initial_datetime + timedelta(seconds=30))
+        actual = session.load(session_instance.session_id)
+
+        assert isinstance(actual, NullSessionInstance)
+
+    @pytest.mark.parametrize('access', [
+        param(lambda session, session_instance: session.load(session_instance.session_id), id='load'),
+        param(lambda session, session_instance: session.save(session_instance), id='save'),
+    ])
     @pytest.mark.parametrize(
-        'created, accessed, expected_expires_post_created, expected_expires_post_accessed', [
-            param('Mar 1 2021, 5 AM', 'Mar 1 2021, 6 AM', NINE_AM, TEN_AM, id='Idle expires before absolute'),
-            param('Mar 1 2021, 5 AM', 'Mar 1 2021, 8 AM', NINE_AM, ELEVEN_AM, id='Absolute causes expiration'),
+        'created, accessed, expected_expires', [
+            param(datetime(2021, 3, 1, 5, tzinfo=timezone.utc), datetime(2021, 3, 1, 6, tzinfo=timezone.utc),
+                  (NINE_AM, TEN_AM), id='Idle expires before absolute'),
+            param(datetime(2021, 3, 1, 5, tzinfo=timezone.utc), datetime(2021, 3, 1, 8, tzinfo=timezone.utc),
+                  (NINE_AM, ELEVEN_AM), id='Absolute causes expiration'),
         ]
     )
-    def test_created_accessed_expires_value_for_create_save(
-            self, mocker, created, accessed, expected_expires_post_created,
-            expected_expires_post_accessed):
+    def test_created_accessed_expires_value_for_create_access(self, clock, access, created, accessed,
+                                                              expected_expires):
         """
-        Tests that accessing a session an hour after creation updates the `accessed` field, but `created` is not
+        Tests that loading or saving a session after creation updates the `accessed` field, but `created` is not
         affected. `expires` *may* be updated, depending on how close the update is to the timeouts.
 
         IMPORTANT - Timeouts used are:
@@ -267,14 +429,14 @@ class TestIntegration:
             ABSOLUTE - 6 hours
 
         The inputs are roughly the same as in the `test_expiration.test_expiration` test, here we're just making sure
-        the values are persisted and used.
+        the values are persisted and used. `expected_expires` holds the expected values after creating, and after
+        loading or saving.
         """
-        initial_dt = datetime.strptime(created, FRIENDLY_DT_FORMAT).replace(tzinfo=timezone.utc)
-        accessed_dt = datetime.strptime(accessed, FRIENDLY_DT_FORMAT).replace(tzinfo=timezone.utc)
-        expected_created = initial_dt.isoformat()
+        expected_expires_post_created, expected_expires_post_accessed = expected_expires
+        expected_created = int(created.timestamp())
 
         session = create_session_manager()
-        mock_current_datetime(mocker, initial_dt)
+        clock.set(created)
 
         # Create Test
         session_instance = session.create_and_save(idle_timeout_seconds=FOUR_HOURS_IN_SECONDS,
@@ -282,43 +444,44 @@ class TestIntegration:
         self.assert_actual_record_values(session_instance.session_id,
                                          exp_created=expected_created,
                                          exp_expired=expected_expires_post_created,
-                                         exp_accessed=initial_dt.isoformat())
+                                         exp_accessed=created.isoformat())
 
-        # Load Test for new datetime
-        mock_current_datetime(mocker, accessed_dt)
-        session.save(session_instance)
+        # Load or save at the new datetime
+        clock.set(accessed)
+        access(session, session_instance)
         self.assert_actual_record_values(session_instance.session_id,
                                          exp_created=expected_created,
                                          exp_expired=expected_expires_post_accessed,
-                                         exp_accessed=accessed_dt.isoformat())
+                                         exp_accessed=accessed.isoformat())
 
     @staticmethod
     def assert_actual_record_values(session_id, exp_created, exp_expired, exp_accessed):
-        actual_record = get_dynamo_record(session_id)
-
-        assert actual_record['created'] == exp_created
-        assert actual_record['expires'] == exp_expired
-        assert actual_record['accessed'] == exp_accessed
+        assert_record_matches(session_id, {
+            'created': exp_created,
+            'expires': exp_expired,
+            'accessed': exp_accessed,
+        })
 
-    def test_new_session_object_uses_saved_timeouts_not_defaults(self, mocker):
+    def test_new_session_object_uses_saved_timeouts_not_defaults(self, clock):
         expected_idle_timeout = 10
         expected_absolute_timeout = 20
         session = create_session_manager()
         initial_datetime = datetime(2020, 3, 11, 0, 0, 0, 0, tzinfo=timezone.utc)
-        mock_current_datetime(mocker, initial_datetime)
+        clock.set(initial_datetime)
 
         session_instance = session.create_and_save(idle_timeout_seconds=expected_idle_timeout,
                                                    absolute_timeout_seconds=expected_absolute_timeout)
-        actual_record = get_dynamo_record(session_instance.session_id)
 
-        assert actual_record['expires'] == int(initial_datetime.timestamp()) + expected_idle_timeout
-        assert actual_record['idle_timeout'] == expected_idle_timeout
-        assert actual_record['absolute_timeout'] == expected_absolute_timeout
+        assert_record_matches(session_instance.session_id, {
+            'expires': int(initial_datetime.timestamp()) + expected_idle_timeout,
+            'idle_timeout': expected_idle_timeout,
+            'absolute_timeout': expected_absolute_timeout,
+        })
 
-    def test_changed_timeouts_are_allowed(self, mocker):
+    def test_changed_timeouts_are_allowed(self, clock):
         session = create_session_manager()
         initial_datetime = datetime(2020, 3, 11, 0, 0, 0, 0, tzinfo=timezone.utc)
-        mock_current_datetime(mocker, initial_datetime)
+        clock.set(initial_datetime)
 
         first_session_data = session.create_and_save()
         actual_record = get_dynamo_record(first_session_data.session_id)
@@ -333,11 +496,28 @@ class TestIntegration:
         new_session_data.absolute_timeout_seconds = expected_absolute_timeout
 
         new_session.save(new_session_data)
-        actual_record = get_dynamo_record(first_session_data.session_id)
 
-        assert actual_record['expires'] == int(initial_datetime.timestamp()) + expected_idle_timeout
-        assert actual_record['idle_timeout'] == expected_idle_timeout
-        assert actual_record['absolute_timeout'] == expected_absolute_timeout
+        assert_record_matches(first_session_data.session_id, {
+            'expires': int(initial_datetime.timestamp()) + expected_idle_timeout,
+            'idle_timeout': expected_idle_timeout,
+            'absolute_timeout': expected_absolute_timeout,
+        })
+
+    def test_save_stores_expiration_consistent_with_created(self, clock):
+        session = create_session_manager()
+        initial_datetime = datetime(2020, 3, 11, 0, 0, 0, 0, tzinfo=timezone.utc)
+        clock.set(initial_datetime)
+        session_instance = session.create_and_save()
+
+        session_instance.created = initial_datetime + timedelta(hours=1)
+        session.save(session_instance)
+
+        expected_created = int(initial_datetime.timestamp()) + 3600
+        assert_record_matches(session_instance.session_id, {
+            'created': expected_created,
+            'expires': int(initial_datetime.timestamp()) + DEFAULT_IDLE_TIMEOUT,
+            'idle_cutoff': expected_created + DEFAULT_ABSOLUTE_TIMEOUT - DEFAULT_IDLE_TIMEOUT,
+        })
 
     def test_clear_removes_record(self):
         session = create_session_manager()
@@ -353,21 +533,63 @@ class TestIntegration:
         assert actual_record is None
 
     def test_actual_current_timestamps_are_within_two_seconds_of_now(self):
-        expected_datetime = datetime.now(tz=timezone.utc)
-        expected_ttl = int(datetime.now(tz=timezone.utc).timestamp()) + DEFAULT_ABSOLUTE_TIMEOUT
+        now = int(time.time())
         session = create_session_manager()
         session_instance = session.create_and_save()
 
-        actual_record = get_dynamo_record(session_instance.session_id)
+        actual_record = get_dynamo_record(session_instance.session_id, ['expires', 'accessed'])
 
-        assert int(actual_record['expires']) - expected_ttl < 2
-        assert datetime.fromisoformat(actual_record['accessed']) - expected_datetime < timedelta(seconds=2)
+        assert abs(int(actual_record['expires']) - now - DEFAULT_IDLE_TIMEOUT) < 2
+        assert abs(int(datetime.fromisoformat(actual_record['accessed']).timestamp()) - now) < 2
 
     def test_empty_session_id_load_raises(self):
         session = create_session_manager(bad_session_id_raises=True)
         sid = ''
-        expected_loggable_sid = 'cf83e1357eefb8bdf1542850d66d8007d620e4050b5715dc83f4a921d36ce9ce' \
-                                '47d0d13c5d85f2b0ff8318d2877eec2f63b931bd47417a81a538327af927da3e'
+        expected_loggable_sid = 'cae66941d9efbd404e4d88758ea67670'
 
         with pytest.raises(SessionNotFoundError, match=expected_loggable_sid):
             session.load(sid)
+
+    def test_batch_load(self):
+        session = create_session_manager()
+        saved_instances = [session.create_and_save() for _ in range(3)]
+        unsaved_instance = session.create()
+        for instance in saved_instances:
+            instance['key'] = instance.session_id
+            session.save(instance)
+
+        actual = session.batch_load([i.session_id for i in saved_instances] + [unsaved_instance.session_id, ''])
+
+        assert set(actual) == {i.session_id for i in saved_instances}
+        for instance in saved_instances:
+            assert actual[instance.session_id]['key'] == instance.session_id
+
+    def test_batch_load_omits_expired_sessions(self, clock):
+        session = create_session_manager()
+        session_instance = session.create_and_save()
+        clock.set(FUTURE_DATETIME)
+
+        actual = session.batch_load([session_instance.session_id])
+
+        assert not actual
+
+    def test_batch_load_omits_invalid_hmac_sid(self):
+        session = create_session_manager(sid_keys=['foo'])
+        session_instance = session.create_and_save()
+
+        actual = session.batch_load([session_instance.session_id, 'my string.wh6tMHxLgJqB6oY1uT73iMlyrOA'])
+
+        assert list(actual) == [session_instance.session_id]
+
+    def test_batch_load_raises_when_keys_stay_unprocessed(self, mocker):
+        mocker.patch('dynamodb_session_web._session.sleep')
+        session = create_session_manager()
+        session_instance = session.create_and_save()
+        request_items = {TABLE_NAME: {'Keys': [{'id': {'S': session_instance.session_id}}], 'ConsistentRead': True}}
+        batch_get_item = mocker.patch.object(session.boto_client(), 'batch_get_item',
+                                             return_value={'Responses': {}, 'UnprocessedKeys': request_items})
+
+        with pytest.raises(BatchLoadError, match='1 session IDs'):
+            session.batch_load([session_instance.session_id])
+
+        assert batch_get_item.call_count == BATCH_GET_MAX_ATTEMPTS
@@ -0,0 +1,57 @@
+import zlib
+
+import pytest
+from pytest import param
+
+# noinspection PyProtectedMember
+from dynamodb_session_web._session import decode_payload, encode_payload, PAYLOAD_COMPRESSION_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    'data, expected', [
+        param(b'{"foo": "bar"}', b'{"foo": "bar"}', id='Bytes'),
+        param('{"fruit": "pomme"}', b'{"fruit": "pomme"}', id='String is UTF-8 encoded'),
+        param(b'', b'', id='Empty'),
+        param(b'x' * (PAYLOAD_COMPRESSION_THRESHOLD * 4), b'x' * (PAYLOAD_COMPRESSION_THRESHOLD * 4), id='Large'),
+    ]
+)
+def test_payload_round_trip(data, expected):
+    assert decode_payload(encode_payload(data)) == expected
+
+
+def test_small_payload_is_not_compressed():
+    data = b'x' * PAYLOAD_COMPRESSION_THRESHOLD
+
+    assert encode_payload(data) == b'\x00' + data
+
+
+def test_large_payload_is_compressed():
+    data = b'x' * (PAYLOAD_COMPRESSION_THRESHOLD + 1)
+
+    actual = encode_payload(data)
+
+    assert actual[:1] == b'\x01'
+    assert len(actual) < len(data)
+
+
+def test_large_payload_uses_zstd_when_configured():
+    zstandard = pytest.importorskip('zstandard')
+    data = b'x' * (PAYLOAD_COMPRESSION_THRESHOLD + 1)
+
+    actual = encode_payload(data, 'zstd')
+
+    assert actual[:1] == b'\x02'
+    assert zstandard.decompress(actual[1:]) == data
+
+
+def test_zstd_payload_is_decoded():
+    zstandard = pytest.importorskip('zstandard')
+    data = b'x' * (PAYLOAD_COMPRESSION_THRESHOLD + 1)
+
+    assert decode_payload(b'\x02' + zstandard.compress(data)) == data
+
+
+def test_zlib_payload_is_decoded():
+    data = b'x' * (PAYLOAD_COMPRESSION_THRESHOLD + 1)
+
+    assert decode_payload(b'\x01' + zlib.compress(data)) == data
@@ -1,12 +1,23 @@
-from datetime import datetime
-from random import randrange
-from unittest.mock import Mock
+import hashlib
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import count
+from typing import Any, Dict, Iterable, Optional
 
 import boto3
 from dynamodb_session_web import SessionManager, SessionDictInstance
 
-TABLE_NAME = 'app_session'
-LOCAL_ENDPOINT = 'http://localhost:8000'
+WORKER_ID = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+
+# Each pytest-xdist worker uses its own table, since the tables are emptied before each test
+TABLE_NAME = f'app_session_{WORKER_ID}'
+
+# Tests run against moto's server, started in-process by each worker, unless USE_DYNAMODB_LOCAL is set to run them
+# against DynamoDB Local (see docker-compose.yml)
+USE_DYNAMODB_LOCAL = bool(os.environ.get('USE_DYNAMODB_LOCAL'))
+LOCAL_PORT = 8000 if USE_DYNAMODB_LOCAL else 8001 + int(WORKER_ID[len('gw'):])
+LOCAL_ENDPOINT = f'http://localhost:{LOCAL_PORT}'
 LOCAL_REGION_NAME = 'us-east-1'
 
 
@@ -14,24 +25,63 @@ def create_session_manager(**kwargs) -> SessionManager[SessionDictInstance]:
     """
     Creates a SessionCore object configured for integration testing
     """
-    return SessionManager(SessionDictInstance, endpoint_url=LOCAL_ENDPOINT, region_name=LOCAL_REGION_NAME, **kwargs)
+    return SessionManager(SessionDictInstance, table_name=TABLE_NAME, endpoint_url=LOCAL_ENDPOINT,
+                          region_name=LOCAL_REGION_NAME, **kwargs)
 
 
+@lru_cache(maxsize=None)
 def get_dynamo_resource():
+    """ Returns a DynamoDB resource shared by the tests, so the service model is only loaded once. """
     return boto3.resource('dynamodb', endpoint_url=LOCAL_ENDPOINT, region_name=LOCAL_REGION_NAME)
 
 
-def get_dynamo_record(key):
-    dynamodb = get_dynamo_resource()
-    table = dynamodb.Table(TABLE_NAME)
+@lru_cache(maxsize=None)
+def get_dynamo_table():
+    return get_dynamo_resource().Table(TABLE_NAME)
 
-    response = table.get_item(Key={'id': key})
+
+def get_dynamo_record(key, attributes: Optional[Iterable[str]] = None):
+    """ Reads a session record, or only the given attributes of it, leaving out the session data when not needed. """
+    kwargs: Dict[str, Any] = {}
+    if attributes is not None:
+        names = {f'#{name}': name for name in attributes}
+        kwargs = {'ProjectionExpression': ', '.join(names), 'ExpressionAttributeNames': names}
+    response = get_dynamo_table().get_item(Key={'id': key}, ConsistentRead=True, **kwargs)
     return response.get('Item', None)
 
 
-def mock_current_datetime(mocker, val: datetime):
-    mocker.patch('dynamodb_session_web._session.current_datetime', Mock(return_value=val))
+def assert_record_matches(session_id: str, expected: Dict[str, Any]) -> None:
+    """ Asserts that the stored record has the expected attribute values, comparing them all at once for a single
+    diff. Only the expected attributes are read.
+    """
+    record = get_dynamo_record(session_id, expected)
+    assert record is not None
+    assert {key: record.get(key) for key in expected} == expected
+
+
+class Clock:
+    """ Replaces `current_datetime` in tests, returning the datetime last given to `set`. """
+
+    def __init__(self) -> None:
+        self.now: Optional[datetime] = None
+
+    def set(self, val: datetime) -> None:
+        self.now = val
+
+    def __call__(self, datetime_value: Optional[datetime] = None) -> datetime:
+        if datetime_value is not None:
+            return datetime_value
+        return datetime.now(tz=timezone.utc) if self.now is None else self.now
+
+
+def expected_loggable_session_id(session_id: str) -> str:
+    """ Computes a loggable session ID independently of the library, for comparing against its result. """
+    return hashlib.blake2b(session_id.encode(), digest_size=16).hexdigest()
+
+
+_param_counter = count()
 
 
 def str_param() -> str:
-    return str(randrange(100000))
+    """ Returns a string that's distinct from every other one returned in this test process. """
+    return f'param_{next(_param_counter)}'